@@ -102,8 +102,11 @@ class ArrayField(Field):
             if not isinstance(value, list):
                 raise TypeError(f"Array field '{self.name}' must be a list")
             
-            # Validate each element in the array if we have a field_type with validation
-            if hasattr(self.field_type, 'validate'):
+            # Validate each element in the array if we have a field_type with validation.
+            # Numeric types can prove a whole list valid in one call first.
+            if hasattr(self.field_type, 'validate') and not (
+                hasattr(self.field_type, 'validate_bulk') and self.field_type.validate_bulk(value)
+            ):
                 for item in value:
                     if not self.field_type.validate(item):
                         raise ValueError(f"Invalid value in array field '{self.name}': {item}")
@@ -183,11 +186,30 @@ class SparseVectorField(Field):
 
 class VectorField(Field):
     """Special field for vector data"""
+
+    QUANTIZATION_TYPES = ("binary", "scalar", "product")
     
-    def __init__(self, dimensions, distance="Cosine", **kwargs):
+    def __init__(self, dimensions, distance="Cosine", quantization=None,
+                 quantization_always_ram=True, oversampling=3.0, **kwargs):
+        """
+        Args:
+            dimensions: Vector size
+            distance: Distance metric ("Cosine", "Dot", "Euclid", "Manhattan")
+            quantization: Server-side quantization ("binary", "scalar", "product") or None
+            quantization_always_ram: Keep quantized vectors in RAM
+            oversampling: Candidate oversampling factor used to rescore quantized searches
+            **kwargs forwarded to Field (nullable, default, primary_key).
+        """
+        if quantization is not None and quantization not in self.QUANTIZATION_TYPES:
+            raise ValueError(
+                f"Unsupported quantization '{quantization}', expected one of {self.QUANTIZATION_TYPES}"
+            )
         super().__init__(field_type="vector", **kwargs)
         self.dimensions = dimensions
         self.distance = distance
+        self.quantization = quantization
+        self.quantization_always_ram = quantization_always_ram
+        self.oversampling = oversampling
     
     def __set__(self, instance, value):
         if value is not None:
@@ -254,7 +276,20 @@ class ModelMeta(type):
                         cls._fields[key] = value
                         if value.primary_key and cls._pk_field is None:
                             cls._pk_field = key
-        
+
+        # Precompute vector field names so queries and commits skip isinstance checks.
+        # The lookup resolves both descriptors and plain names to the field name.
+        cls._vector_field_names = frozenset(
+            key for key, value in cls._fields.items() if isinstance(value, VectorField)
+        )
+        cls._sparse_field_names = frozenset(
+            key for key, value in cls._fields.items() if isinstance(value, SparseVectorField)
+        )
+        cls._vector_name_lookup = {}
+        for key in cls._vector_field_names | cls._sparse_field_names:
+            cls._vector_name_lookup[key] = key
+            cls._vector_name_lookup[cls._fields[key]] = key
+
         return cls
 
 
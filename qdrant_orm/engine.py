@@ -2,11 +2,12 @@
 Engine and session classes for Qdrant ORM
 """
 from typing import Dict, Any, Type, List, Optional, Union, Tuple
+import functools
 import uuid
 import re
 import traceback
 
-from qdrant_client import QdrantClient
+from qdrant_client import QdrantClient, AsyncQdrantClient
 from qdrant_client.http import models as qmodels
 from qdrant_client.http.models import SparseVector
 from .base import Base,VectorField,SparseVectorField
@@ -27,7 +28,7 @@ class QdrantEngine:
             prefix: URL prefix
             timeout: Connection timeout in seconds
         """
-        self.client = QdrantClient(
+        self._client_kwargs = dict(
             url=url,
             port=port,
             api_key=api_key,
@@ -35,6 +36,29 @@ class QdrantEngine:
             prefix=prefix,
             timeout=timeout
         )
+        self.client = QdrantClient(**self._client_kwargs)
+        # Created on first use, only needed for concurrent searches
+        self.async_client = None
+    
+    @classmethod
+    def from_client(cls, client: QdrantClient,
+                    async_client: Optional[AsyncQdrantClient] = None) -> "QdrantEngine":
+        """
+        Create an engine around an existing Qdrant client
+        
+        Args:
+            client: Client to use for all operations
+            async_client: Optional async client for concurrent searches
+            
+        Returns:
+            QdrantEngine instance that does not open a connection of its own
+        """
+        engine = cls.__new__(cls)
+        # No connection settings, so an async client cannot be derived later
+        engine._client_kwargs = None
+        engine.client = client
+        engine.async_client = async_client
+        return engine
     
     def create_collection(self, collection_name: str, model_class: Type[Base]):
         """
@@ -74,7 +98,11 @@ class QdrantEngine:
             # 2) Build a **named** vectors_config for every dense field
             #    (never use the single-vector shorthand)
             vectors_config = {
-                name: qmodels.VectorParams(size=fld.dimensions, distance=fld.distance)
+                name: qmodels.VectorParams(
+                    size=fld.dimensions,
+                    distance=fld.distance,
+                    quantization_config=_build_quantization_config(fld)
+                )
                 for name, fld in dense_fields.items()
             }
 
@@ -122,6 +150,58 @@ class QdrantEngine:
         """Get the underlying Qdrant client"""
         return self.client
 
+    def get_async_client(self) -> AsyncQdrantClient:
+        """Get an async Qdrant client for the same server, creating it on first use"""
+        if self.async_client is None:
+            if self._client_kwargs is None:
+                raise ValueError(
+                    "Engine was created from an existing client; "
+                    "pass async_client to QdrantEngine.from_client for concurrent searches"
+                )
+            self.async_client = AsyncQdrantClient(**self._client_kwargs)
+        return self.async_client
+
+
+def _build_quantization_config(field: VectorField):
+    """
+    Build the Qdrant quantization config for a vector field
+
+    Args:
+        field: VectorField with an optional quantization setting
+
+    Returns:
+        Quantization config model, or None if the field is not quantized
+    """
+    if field.quantization == "binary":
+        return qmodels.BinaryQuantization(
+            binary=qmodels.BinaryQuantizationConfig(always_ram=field.quantization_always_ram)
+        )
+    if field.quantization == "scalar":
+        return qmodels.ScalarQuantization(
+            scalar=qmodels.ScalarQuantizationConfig(
+                type=qmodels.ScalarType.INT8,
+                quantile=0.99,
+                always_ram=field.quantization_always_ram
+            )
+        )
+    if field.quantization == "product":
+        return qmodels.ProductQuantization(
+            product=qmodels.ProductQuantizationConfig(
+                compression=qmodels.CompressionRatio.X16,
+                always_ram=field.quantization_always_ram
+            )
+        )
+    return None
+
+
+_UUID_RE = re.compile(r'^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$')
+
+
+@functools.lru_cache(maxsize=8192)
+def _uuid5_for(name: str) -> str:
+    """Deterministic UUID string for a string ID, hashed once per distinct ID"""
+    return str(uuid.uuid5(uuid.NAMESPACE_DNS, name))
+
 
 def _convert_id_for_qdrant(id_value):
     """
@@ -138,7 +218,7 @@ def _convert_id_for_qdrant(id_value):
         return str(id_value)
     
     # If it's a UUID string, convert to UUID object
-    if isinstance(id_value, str) and re.match(r'^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$', id_value.lower()):
+    if isinstance(id_value, str) and _UUID_RE.match(id_value.lower()):
         return id_value
     
     # If it's an integer, use it directly
@@ -148,10 +228,68 @@ def _convert_id_for_qdrant(id_value):
     # For string IDs, generate a deterministic UUID based on the string
     if isinstance(id_value, str):
         # Use UUID5 with DNS namespace for deterministic generation
-        return str(uuid.uuid5(uuid.NAMESPACE_DNS, id_value))
+        return _uuid5_for(id_value)
     
     # For any other type, convert to string and then to UUID
-    return str(uuid.uuid5(uuid.NAMESPACE_DNS, str(id_value)))
+    return _uuid5_for(str(id_value))
+
+
+def _to_sparse_vector(value):
+    """
+    Convert a sparse field value to a SparseVector
+
+    Args:
+        value: Dict with "indices" and "values" lists, or an existing SparseVector
+
+    Returns:
+        SparseVector instance (or the value unchanged if it is not a dict)
+    """
+    if isinstance(value, dict):
+        return SparseVector(indices=value["indices"], values=value["values"])
+    return value
+
+
+def _split_and_encode(instances: List[Base], vector_names: frozenset, pk_field: str,
+                      sparse_names: frozenset = frozenset()):
+    """
+    Split model instances into point ids, vectors and payloads for upsert
+
+    Args:
+        instances: Model instances of a single model class
+        vector_names: Names of the dense and sparse vector fields of the model
+        pk_field: Name of the primary key field
+        sparse_names: Names of the sparse vector fields, encoded as SparseVector
+
+    Returns:
+        Tuple of (original_ids, vectors, payloads) lists, aligned with instances
+    """
+    original_ids = []
+    vectors_list = []
+    payloads = []
+
+    for instance in instances:
+        vectors = {}
+        payload = {}
+        for name, value in instance._values.items():
+            if name in sparse_names:
+                vectors[name] = _to_sparse_vector(value)
+            elif name in vector_names:
+                vectors[name] = value
+            else:
+                payload[name] = value
+
+        # Ensure primary key
+        original_id = getattr(instance, pk_field, None)
+        if original_id is None:
+            original_id = str(uuid.uuid4())
+            setattr(instance, pk_field, original_id)
+        payload[pk_field] = original_id
+
+        original_ids.append(original_id)
+        vectors_list.append(vectors)
+        payloads.append(payload)
+
+    return original_ids, vectors_list, payloads
 
 
 class QdrantSession:
@@ -199,35 +337,31 @@ class QdrantSession:
         for collection, operations in operations_by_collection.items():
             # Process additions
             if operations['add']:
-                points = []
+                # Models sharing a collection may declare different fields, so
+                # resolve the layout once per model class, not per point
+                by_class = {}
                 for instance in operations['add']:
-                    vectors = {}
-                    payload = {}
-
-                    # Split out both dense and sparse vector fields
-                    for name, value in instance._values.items():
-                        field = instance.__class__._fields.get(name)
-                        if isinstance(field, (VectorField, SparseVectorField)):
-                            vectors[name] = value
-                        else:
-                            payload[name] = value
-
-                    # Ensure primary key
-                    original_id = getattr(instance, instance.__class__._pk_field, None)
-                    if original_id is None:
-                        original_id = str(uuid.uuid4())
-                        setattr(instance, instance.__class__._pk_field, original_id)
-                    qdrant_id = _convert_id_for_qdrant(original_id)
-                    self._id_mapping[(collection, original_id)] = qdrant_id
-                    payload[instance.__class__._pk_field] = original_id
-
-                    # FIX: Always use a dictionary for vectors, even for a single vector.
-                    # The previous logic was causing issues with single-vector upserts.
-                    points.append(qmodels.PointStruct(
-                        id=qdrant_id,
-                        vector=vectors,  # Always pass the dictionary
-                        payload=payload
-                    ))
+                    by_class.setdefault(type(instance), []).append(instance)
+
+                points = []
+                for model_class, instances in by_class.items():
+                    sparse_names = model_class._sparse_field_names
+                    vector_names = model_class._vector_field_names | sparse_names
+                    original_ids, vectors_list, payloads = _split_and_encode(
+                        instances, vector_names, model_class._pk_field, sparse_names
+                    )
+
+                    for original_id, vectors, payload in zip(original_ids, vectors_list, payloads):
+                        qdrant_id = _convert_id_for_qdrant(original_id)
+                        self._id_mapping[(collection, original_id)] = qdrant_id
+
+                        # FIX: Always use a dictionary for vectors, even for a single vector.
+                        # The previous logic was causing issues with single-vector upserts.
+                        points.append(qmodels.PointStruct(
+                            id=qdrant_id,
+                            vector=vectors,  # Always pass the dictionary
+                            payload=payload
+                        ))
 
                 self.client.upsert(
                     collection_name=collection, 
@@ -240,7 +374,9 @@ class QdrantSession:
                 ids = []
                 for instance in operations['delete']:
                     orig = instance.pk
-                    q_id = self._id_mapping.get((collection, orig), _convert_id_for_qdrant(orig))
+                    q_id = self._id_mapping.get((collection, orig))
+                    if q_id is None:
+                        q_id = _convert_id_for_qdrant(orig)
                     ids.append(q_id)
                 self.client.delete(
                     collection_name=collection,
@@ -271,6 +407,15 @@ class QdrantSession:
         """
         return self.client
     
+    def _get_async_client(self):
+        """
+        Get the async Qdrant client
+        
+        Returns:
+            AsyncQdrantClient instance
+        """
+        return self.engine.get_async_client()
+    
     def _point_to_model(self, point, model_class: Type[Base]):
         """
         Convert a Qdrant point to a model instance
@@ -343,10 +488,9 @@ class QdrantSession:
         collection = model_class.__collection__
         
         # Convert ID to Qdrant-compatible format
-        qdrant_id = self._id_mapping.get(
-            (collection, id_value), 
-            _convert_id_for_qdrant(id_value)
-        )
+        qdrant_id = self._id_mapping.get((collection, id_value))
+        if qdrant_id is None:
+            qdrant_id = _convert_id_for_qdrant(id_value)
         
         result = self.client.retrieve(
             collection_name=collection,
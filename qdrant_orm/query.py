@@ -1,10 +1,15 @@
+import asyncio
+import logging
+import math
 from typing import Any, Dict, Generator, List, Optional, Tuple, Type, Union
-from qdrant_client.http.models import Filter as QdrantFilter, MatchExcept, NamedVector, NamedSparseVector, SparseVector
-from qdrant_client.http.models import SearchParams
+
+import numpy as np
+from qdrant_client.http.models import Filter as QdrantFilter, MatchExcept, NamedVector, NamedSparseVector
+from qdrant_client.http.models import SearchParams, QuantizationSearchParams, SearchRequest
 import qdrant_orm
-from .base import Base, Field, VectorField
+from .base import Base, Field, VectorField, SparseVectorField
 from .filters import Filter, FilterGroup
-from .engine import _convert_id_for_qdrant
+from .engine import _convert_id_for_qdrant, _to_sparse_vector
 from qdrant_client.http.models import (
     Filter       as QdrantFilter,
     FieldCondition,
@@ -19,10 +24,158 @@ from qdrant_client.http.models import (
     ValuesCount,       # for filtering by array length
     NestedCondition,   # for nested object filtering
     Nested,            # for nested object filtering
+    PayloadField,      # for is_empty / is_null conditions
 )
 from sqlalchemy import and_
 
 
+logger = logging.getLogger(__name__)
+
+# Marks the cached Qdrant filter as not yet built
+_SENTINEL = object()
+
+
+def _not_in_condition(model_class, key, val):
+    """Build a MatchExcept condition, casting the values to the field's type."""
+    # Ensure val is a list
+    if not isinstance(val, (list, tuple)):
+        val = [val]
+    # Try to use model field type for robust casting
+    field_type = None
+    if hasattr(model_class, '_fields'):
+        field_obj = model_class._fields.get(key)
+        if field_obj and hasattr(field_obj, 'field_type'):
+            field_type = field_obj.field_type
+    from qdrant_orm.types import Integer, Float, String, Boolean
+    if field_type:
+        if isinstance(field_type, Integer):
+            val = [int(v) for v in val]
+            return FieldCondition(key=key, match=MatchExcept(**{"except": val}))
+        elif isinstance(field_type, String):
+            val = [str(v) for v in val]
+            return FieldCondition(key=key, match=MatchExcept(**{"except": val}))
+        elif isinstance(field_type, Float):
+            # Float fields don't support MatchExcept in Qdrant
+            # and exact float matching is problematic due to precision
+            raise ValueError(
+                f"'not_in' filter is not supported for float field '{key}'. "
+                f"Qdrant does not support MatchExcept for float values. "
+                f"Consider using integer or string fields for exact matching, "
+                f"or use range filters (>, <, >=, <=) for float comparisons."
+            )
+        elif isinstance(field_type, Boolean):
+            val = [bool(v) for v in val]
+            return FieldCondition(key=key, match=MatchExcept(**{"except": val}))
+        else:
+            val = [str(v) for v in val]
+            return FieldCondition(key=key, match=MatchExcept(**{"except": val}))
+    # Fallback: infer from first value
+    if val:
+        first = val[0]
+        if isinstance(first, int):
+            val = [int(v) for v in val]
+        elif isinstance(first, str):
+            val = [str(v) for v in val]
+        elif isinstance(first, float):
+            # Float fields don't support MatchExcept in Qdrant
+            # and exact float matching is problematic due to precision
+            raise ValueError(
+                f"'not_in' filter is not supported for float field '{key}'. "
+                f"Qdrant does not support MatchExcept for float values. "
+                f"Consider using integer or string fields for exact matching, "
+                f"or use range filters (>, <, >=, <=) for float comparisons."
+            )
+        else:
+            val = [str(v) for v in val]
+    return FieldCondition(key=key, match=MatchExcept(**{"except": val}))
+
+
+def _in_condition(model_class, key, val):
+    # Ensure val is a list and use correct MatchAny syntax
+    if not isinstance(val, (list, tuple)):
+        val = [val]
+    return FieldCondition(key=key, match=MatchAny(any=list(val)))
+
+
+def _contains_any_condition(model_class, key, val):
+    # Convert values to strings for MatchAny
+    if isinstance(val, (list, tuple)):
+        val = [str(v) for v in val]
+    return FieldCondition(key=key, match=MatchAny(any=val))
+
+
+def _contains_all_condition(model_class, key, val):
+    # For contains_all, we need to create multiple conditions with AND logic
+    conditions = []
+    if isinstance(val, (list, tuple)):
+        for item in val:
+            conditions.append(FieldCondition(key=key, match=MatchValue(value=str(item))))
+    return conditions
+
+
+def _values_count_condition(model_class, key, val):
+    # val should be a dict with gt, gte, lt, lte keys
+    if isinstance(val, dict):
+        return FieldCondition(key=key, values_count=ValuesCount(**val))
+    raise ValueError(f"values_count operator requires a dict with gt/gte/lt/lte keys, got {type(val)}")
+
+
+def _match_value_condition(model_class, key, val):
+    return FieldCondition(key=key, match=MatchValue(value=val))
+
+
+# Filter operator -> Qdrant condition builder used by searches, scrolls and counts.
+# Each builder takes (model_class, key, value); "!=" and "not_in" conditions are
+# placed under must_not by the caller.
+_CONDITION_BUILDERS = {
+    "==": _match_value_condition,
+    "!=": _match_value_condition,
+    "ne": _match_value_condition,
+    "in": _in_condition,
+    "not_in": _not_in_condition,
+    "contains": _match_value_condition,
+    "contains_any": _contains_any_condition,
+    "contains_all": _contains_all_condition,
+    ">": lambda m, k, v: FieldCondition(key=k, range=Range(gt=v)),
+    ">=": lambda m, k, v: FieldCondition(key=k, range=Range(gte=v)),
+    "<": lambda m, k, v: FieldCondition(key=k, range=Range(lt=v)),
+    "<=": lambda m, k, v: FieldCondition(key=k, range=Range(lte=v)),
+    "is_empty": lambda m, k, v: IsEmptyCondition(is_empty=PayloadField(key=k)),
+    "is_null": lambda m, k, v: IsNullCondition(is_null=PayloadField(key=k)),
+    "text_match": lambda m, k, v: FieldCondition(key=k, match=MatchText(text=v)),
+    "values_count": _values_count_condition,
+}
+
+# Rank offset of reciprocal rank fusion, the value proposed by Cormack et al.
+_RRF_K = 60
+
+# Ways combined_vector_search can fuse per-field results
+_FUSION_MODES = ("weighted", "rrf")
+
+
+def _as_dense_vector(vector):
+    """Return a dense query vector as a float list, converting NumPy input once.
+
+    Qdrant stores dense vectors as float32, so array input is cast to a contiguous
+    float32 array before being unpacked.
+    """
+    if isinstance(vector, np.ndarray):
+        return np.ascontiguousarray(vector, dtype=np.float32).tolist()
+    if isinstance(vector, tuple):
+        return list(vector)
+    return vector
+
+
+def _prep_query(vector) -> np.ndarray:
+    """Return a query vector as a contiguous float32 array, the precision Qdrant stores."""
+    return np.ascontiguousarray(vector, dtype=np.float32)
+
+
+def _build_sparse_request(name: str, vector: Dict[str, List]) -> NamedSparseVector:
+    """Build a named sparse query vector from an indices/values dict."""
+    return NamedSparseVector(name=name, vector=_to_sparse_vector(vector))
+
+
 class Query:
     """Query class for building and executing queries against Qdrant collections."""
 
@@ -48,6 +201,7 @@ class Query:
         self._group_size: int = 1
         self._prefetch_vector_field: Optional[str] = None
         self._prefetch_vector_value: Optional[List[float]] = None
+        self._cached_qdrant_filter = _SENTINEL
 
     def filter(self, *args: Filter) -> "Query":
         """Add filters to the query."""
@@ -56,6 +210,7 @@ class Query:
             if not (isinstance(arg, Filter) or isinstance(arg, qdrant_orm.filters.Filter)):
                 raise TypeError(f"Expected Filter object, got {type(arg)}")
             self._filters.append(arg)
+        self._cached_qdrant_filter = _SENTINEL
         return self
 
     def vector_search(
@@ -65,17 +220,13 @@ class Query:
         query_vector: List[float] = None
     ) -> "Query":
         """Perform a vector search."""
-        if isinstance(field, VectorField):
-            self._vector_field = field.name
-        else:
-            self._vector_field = field
+        self._vector_field = self._vector_field_name(field)
 
         if query_vector is not None:
-            self._vector_value = query_vector
-        elif vector is not None:
-            self._vector_value = vector
-        else:
+            vector = query_vector
+        elif vector is None:
             raise ValueError("Either 'vector' or 'query_vector' must be provided")
+        self._vector_value = vector if isinstance(vector, dict) else _as_dense_vector(vector)
         return self
 
     def limit(self, limit: int) -> "Query":
@@ -102,13 +253,10 @@ class Query:
     
     def prefetch(self, field: Union[str, VectorField],
             query_vector: List[float] = None) -> "Query":
-        if isinstance(field, VectorField):
-            self._prefetch_vector_field = field.name
-        else:
-            self._prefetch_vector_field = field
+        self._prefetch_vector_field = self._vector_field_name(field)
 
         if query_vector is not None:
-            self._prefetch_vector_value = query_vector
+            self._prefetch_vector_value = _as_dense_vector(query_vector)
         return self
 
     def score_threshold(self, threshold: float) -> "Query":
@@ -162,8 +310,8 @@ class Query:
             if result and len(result) > 0:
                 return self._session._point_to_model(result[0], self._model_class)
             return None
-        except Exception as e:
-            print(f"Error retrieving record: {e}")
+        except Exception:
+            logger.exception("Error retrieving record")
             return None
 
     def all(self) -> List[Base]:
@@ -180,21 +328,15 @@ class Query:
             return self._get_combined_search_results()
 
         # 3) Single-field vector search (dense or sparse)
-        if self._vector_field and self._vector_value:
-            vec_name = getattr(self._vector_field, "name", self._vector_field)
-
-            if isinstance(self._vector_value, dict):
+        vec_name = self._vector_field
+        vector_value = self._vector_value
+        if vec_name and vector_value:
+            if isinstance(vector_value, dict):
                 # Sparse vector path
-                search_request = NamedSparseVector(
-                    name=vec_name,
-                    vector=SparseVector(
-                        indices=self._vector_value["indices"],
-                        values=self._vector_value["values"]
-                    )
-                )
+                search_request = _build_sparse_request(vec_name, vector_value)
             else:
                 # Dense vector path
-                search_request = NamedVector(name=vec_name, vector=self._vector_value)
+                search_request = NamedVector(name=vec_name, vector=vector_value)
 
             search_params = {
                 "collection_name": collection_name,
@@ -210,6 +352,10 @@ class Query:
             if qfilter:
                 search_params["query_filter"] = qfilter
 
+            quant_params = self._quantization_search_params(vec_name)
+            if quant_params is not None:
+                search_params["search_params"] = quant_params
+
             try:
                 results = client.search(**search_params)
                 
@@ -221,8 +367,8 @@ class Query:
                     results = results[:self._limit]
                 
                 return [self._session._point_to_model(pt, self._model_class) for pt in results]
-            except Exception as e:
-                print(f"Error during vector search: {e}")
+            except Exception:
+                logger.exception("Error during vector search")
                 return []
 
         # 4) Non-vector queries - FIXED SCROLL WITH OFFSET
@@ -263,6 +409,9 @@ class Query:
                     search_params["query_filter"] = qfilter
                 if self._score_threshold is not None:
                     search_params["score_threshold"] = self._score_threshold
+                quant_params = self._quantization_search_params(vec_name)
+                if quant_params is not None:
+                    search_params["search_params"] = quant_params
 
                 results = client.search(**search_params)
                 
@@ -308,14 +457,75 @@ class Query:
                 
                 return [self._session._point_to_model(pt, self._model_class) for pt in sliced_points]
 
-        except Exception as e:
-            print(f"Error during scroll/search: {e}")
+        except Exception:
+            logger.exception("Error during scroll/search")
             return []
 
     def first(self) -> Optional[Base]:
         results = self.limit(1).all()
         return results[0] if results else None
-    
+
+    @classmethod
+    def batch_first(cls, queries: List["Query"]) -> List[Optional[Base]]:
+        """Return ``first()`` for each query, in input order.
+
+        Plain vector searches against the same collection are sent together in one
+        ``search_batch`` request instead of one round trip each. Any other query
+        (scroll, grouping, recommend, combined search) falls back to ``first()``.
+        """
+        results: List[Optional[Base]] = [None] * len(queries)
+        batches: Dict[Tuple[int, str], List[Tuple[int, "Query", SearchRequest]]] = {}
+        for i, query in enumerate(queries):
+            request = query._first_search_request()
+            if request is None:
+                results[i] = query.first()
+                continue
+            key = (id(query._session), query._model_class.__collection__)
+            batches.setdefault(key, []).append((i, query, request))
+
+        for (_, collection_name), items in batches.items():
+            session = items[0][1]._session
+            try:
+                batched = session._get_client().search_batch(
+                    collection_name=collection_name,
+                    requests=[request for _, _, request in items],
+                )
+            except Exception:
+                logger.exception("Error during batched vector search")
+                continue
+            for (i, query, _), hits in zip(items, batched):
+                if len(hits) > query._offset:
+                    results[i] = session._point_to_model(hits[query._offset], query._model_class)
+        return results
+
+    def _first_search_request(self) -> Optional[SearchRequest]:
+        """Build the search request behind ``first()`` for a plain vector search."""
+        if hasattr(self, "_recommend_params") or hasattr(self, "_combined_search_params"):
+            return None
+        vec_name = self._vector_field
+        vector_value = self._vector_value
+        if not (vec_name and vector_value):
+            return None
+        if isinstance(vector_value, dict):
+            vector = _build_sparse_request(vec_name, vector_value)
+        else:
+            vector = NamedVector(name=vec_name, vector=vector_value)
+        request: Dict[str, Any] = {
+            "vector": vector,
+            "limit": 1 + self._offset,
+            "with_payload": self._with_payload,
+            "with_vector": self._with_vectors,
+        }
+        if self._score_threshold is not None:
+            request["score_threshold"] = self._score_threshold
+        qfilter = self._build_qdrant_filter()
+        if qfilter:
+            request["filter"] = qfilter
+        quant_params = self._quantization_search_params(vec_name)
+        if quant_params is not None:
+            request["params"] = quant_params
+        return SearchRequest(**request)
+
     def ids(self) -> Generator:
         client = self._session._get_client()
         collection_name = self._model_class.__collection__
@@ -326,14 +536,15 @@ class Query:
             "with_payload": False,
             "with_vectors": False,
         }
-        if self._build_qdrant_filter():
-            scroll_params["scroll_filter"] = self._build_qdrant_filter()
+        qfilter = self._build_qdrant_filter()
+        if qfilter:
+            scroll_params["scroll_filter"] = qfilter
         try:
             scroll_result, _ = client.scroll(**scroll_params)
             ids = [point.id for point in scroll_result]
             yield ids
-        except Exception as e:
-            print(f"Error during scroll: {e}")
+        except Exception:
+            logger.exception("Error during scroll")
             yield []
 
 
@@ -341,13 +552,14 @@ class Query:
         client = self._session._get_client()
         collection_name = self._model_class.__collection__
         count_params: Dict[str, Any] = {"collection_name": collection_name}
-        if self._build_qdrant_filter():
-            count_params["count_filter"] = self._build_qdrant_filter()
+        qfilter = self._build_qdrant_filter()
+        if qfilter:
+            count_params["count_filter"] = qfilter
         try:
             result = client.count(**count_params)
             return result.count
-        except Exception as e:
-            print(f"Error counting records: {e}")
+        except Exception:
+            logger.exception("Error counting records")
             return 0
 
     def _execute_recommend_search(self) -> List[Base]:
@@ -382,7 +594,7 @@ class Query:
                     break
         
         if not vector_field_name:
-            print("Error: No vector field found for recommendation")
+            logger.error("No vector field found for recommendation on %s", self._model_class.__name__)
             return []
         
         # Build recommendation request
@@ -409,52 +621,79 @@ class Query:
         try:
             results = client.recommend(**recommend_params)
             return [self._session._point_to_model(pt, self._model_class) for pt in results]
-        except Exception as e:
-            print(f"Error during recommendation search: {e}")
+        except Exception:
+            logger.exception("Error during recommendation search")
             return []
 
+    def _vector_field_name(self, field: Union[str, VectorField, SparseVectorField]) -> str:
+        """Resolve a vector field descriptor or name to the field name."""
+        name = self._model_class._vector_name_lookup.get(field)
+        if name is not None:
+            return name
+        # Descriptor from another model or an unknown name
+        return field.name if isinstance(field, (VectorField, SparseVectorField)) else field
+
+    def _quantization_search_params(self, field_name: str) -> Optional[SearchParams]:
+        """Rescoring search params for a quantized vector field, or None."""
+        field = self._model_class._fields.get(field_name)
+        if getattr(field, "quantization", None) is None:
+            return None
+        return SearchParams(
+            quantization=QuantizationSearchParams(rescore=True, oversampling=field.oversampling)
+        )
+
     def _build_qdrant_filter(self) -> Optional[QdrantFilter]:
+        """Return the Qdrant filter for this query, building it at most once."""
+        if self._cached_qdrant_filter is _SENTINEL:
+            self._cached_qdrant_filter = self._compute_qdrant_filter()
+        return self._cached_qdrant_filter
+
+    def _compute_qdrant_filter(self) -> Optional[QdrantFilter]:
         if not self._filters:
             return None
-
-        must, must_not, should = [], [], []
-
-        for filt in self._filters:
-            # handle groups
-            if isinstance(filt, FilterGroup):
-                for child in filt.filters:
-                    cond = self._make_qdrant_condition(child)
-                    if cond is None:  # Skip None conditions
-                        continue
-                    if isinstance(cond, list):  # Handle contains_all or not_in float conditions
-                        if child.operator in ("not_in", "!="):
-                            must_not.extend(cond)
-                        else:
-                            must.extend(cond)
+        # The query's filters are ANDed like the children of an "and" group, so groups
+        # mean the same at the top level as nested. A lone group is the filter itself.
+        if len(self._filters) == 1 and isinstance(self._filters[0], FilterGroup):
+            return self._group_filter(self._filters[0])
+        return self._group_filter(FilterGroup("and", self._filters))
+
+    def _group_filter(self, group: FilterGroup) -> QdrantFilter:
+        """Convert a filter group and any groups nested in it into a Qdrant filter.
+
+        The tree is walked with an explicit stack, so deep nesting costs no Python
+        call frames and cannot hit the recursion limit. Each sub-filter is appended
+        to its parent clause first and filled in when its group is popped. The
+        returned filter always has list clauses, never None.
+        """
+        root = QdrantFilter(must=[], must_not=[], should=[])
+        stack = [(group, root)]
+        while stack:
+            node, target = stack.pop()
+            conjunctive = node.logic == "and"
+            clause = target.must if conjunctive else target.should
+            for child in node.filters:
+                if isinstance(child, FilterGroup):
+                    sub = QdrantFilter(must=[], must_not=[], should=[])
+                    clause.append(sub)
+                    stack.append((child, sub))
+                    continue
+                cond = self._make_qdrant_condition(child)
+                if cond is None:
+                    continue
+                conds = cond if isinstance(cond, list) else [cond]
+                if child.operator in ("!=", "not_in"):
+                    if conjunctive:
+                        target.must_not.extend(conds)
                     else:
-                        (must if filt.logic=="and" else should).append(cond)
-                continue
-
-            cond = self._make_qdrant_condition(filt)
-            if cond is None:  # Skip None conditions
-                continue
-            
-            if isinstance(cond, list):  # Handle contains_all or not_in float conditions
-                if filt.operator in ("not_in", "!="):
-                    must_not.extend(cond)
+                        clause.append(QdrantFilter(must_not=conds))
+                elif conjunctive:
+                    clause.extend(conds)
+                elif isinstance(cond, list):
+                    # contains_all inside an "or" group: all of its conditions must hold
+                    clause.append(QdrantFilter(must=conds))
                 else:
-                    must.extend(cond)
-            elif filt.operator in ("!=", "not_in"):
-                must_not.append(cond)
-            else:
-                must.append(cond)
-
-        # Always pass lists, never None
-        return QdrantFilter(
-            must=must,
-            must_not=must_not,
-            should=should
-        )
+                    clause.append(cond)
+        return root
 
     def _make_qdrant_condition(self, filt: Filter):
         key, op, val = filt.field_name, filt.operator, filt.value
@@ -463,151 +702,10 @@ class Query:
         if val is None:
             return None
 
-        if op == "==":
-            return FieldCondition(key=key, match=MatchValue(value=val))
-
-        if op == "!=" or op == "ne":
-            return FieldCondition(key=key, match=MatchValue(value=val))
-
-        if op == "in":
-            # Ensure val is a list and use correct MatchAny syntax
-            if not isinstance(val, (list, tuple)):
-                val = [val]
-            return FieldCondition(key=key, match=MatchAny(any=list(val)))
-
-        if op == "not_in":
-            # Ensure val is a list
-            if not isinstance(val, (list, tuple)):
-                val = [val]
-            # Try to use model field type for robust casting
-            field_type = None
-            if hasattr(self, '_model_class') and hasattr(self._model_class, '_fields'):
-                field_obj = self._model_class._fields.get(key)
-                if field_obj and hasattr(field_obj, 'field_type'):
-                    field_type = field_obj.field_type
-            from qdrant_orm.types import Integer, Float, String, Boolean
-            if field_type:
-                if isinstance(field_type, Integer):
-                    val = [int(v) for v in val]
-                    return FieldCondition(key=key, match=MatchExcept(**{"except": val}))
-                elif isinstance(field_type, String):
-                    val = [str(v) for v in val]
-                    return FieldCondition(key=key, match=MatchExcept(**{"except": val}))
-                elif isinstance(field_type, Float):
-                    # Float fields don't support MatchExcept in Qdrant
-                    # and exact float matching is problematic due to precision
-                    raise ValueError(
-                        f"'not_in' filter is not supported for float field '{key}'. "
-                        f"Qdrant does not support MatchExcept for float values. "
-                        f"Consider using integer or string fields for exact matching, "
-                        f"or use range filters (>, <, >=, <=) for float comparisons."
-                    )
-                elif isinstance(field_type, Boolean):
-                    val = [bool(v) for v in val]
-                    return FieldCondition(key=key, match=MatchExcept(**{"except": val}))
-                else:
-                    val = [str(v) for v in val]
-                    return FieldCondition(key=key, match=MatchExcept(**{"except": val}))
-            # Fallback: infer from first value
-            if val:
-                first = val[0]
-                if isinstance(first, int):
-                    val = [int(v) for v in val]
-                elif isinstance(first, str):
-                    val = [str(v) for v in val]
-                elif isinstance(first, float):
-                    # Float fields don't support MatchExcept in Qdrant
-                    # and exact float matching is problematic due to precision
-                    raise ValueError(
-                        f"'not_in' filter is not supported for float field '{key}'. "
-                        f"Qdrant does not support MatchExcept for float values. "
-                        f"Consider using integer or string fields for exact matching, "
-                        f"or use range filters (>, <, >=, <=) for float comparisons."
-                    )
-                else:
-                    val = [str(v) for v in val]
-            return FieldCondition(key=key, match=MatchExcept(**{"except": val}))
-
-        if op == "contains":
-            return FieldCondition(key=key, match=MatchValue(value=val))
-
-        if op == "contains_any":
-            # Convert values to strings for MatchAny
-            if isinstance(val, (list, tuple)):
-                val = [str(v) for v in val]
-            return FieldCondition(key=key, match=MatchAny(any=val))
-
-        if op == "contains_all":
-            # For contains_all, we need to create multiple conditions with AND logic
-            conditions = []
-            if isinstance(val, (list, tuple)):
-                for item in val:
-                    conditions.append(FieldCondition(key=key, match=MatchValue(value=str(item))))
-            return conditions
-
-        if op in (">", ">=", "<", "<="):
-            kwargs = {}
-            if op == ">":   kwargs["gt"]  = val
-            if op == ">=":  kwargs["gte"] = val
-            if op == "<":   kwargs["lt"]  = val
-            if op == "<=":  kwargs["lte"] = val
-            return FieldCondition(key=key, range=Range(**kwargs))
-
-        if op == "is_empty":
-            from qdrant_client.http.models import PayloadField
-            return IsEmptyCondition(is_empty=PayloadField(key=key))
-
-        if op == "is_null":
-            from qdrant_client.http.models import PayloadField
-            return IsNullCondition(is_null=PayloadField(key=key))
-
-        if op == "text_match":
-            return FieldCondition(key=key, match=MatchText(text=val))
-
-        if op == "values_count":
-            # val should be a dict with gt, gte, lt, lte keys
-            if isinstance(val, dict):
-                return FieldCondition(key=key, values_count=ValuesCount(**val))
-            else:
-                raise ValueError(f"values_count operator requires a dict with gt/gte/lt/lte keys, got {type(val)}")
-
-        raise ValueError(f"Unsupported operator: {op}")
-
-    def _convert_filter_to_qdrant(self, filt: Filter) -> Dict[str,Any]:
-        # no more FilterGroup handling here!
-        field, op, value = filt.field_name, filt.operator, filt.value
-
-        if op == "==":
-            return {"key": field, "match": {"value": value}}
-        if op in (">", ">=", "<", "<="):
-            rng = {}
-            if op == ">":   rng["gt"]  = value
-            if op == ">=":  rng["gte"] = value
-            if op == "<":   rng["lt"]  = value
-            if op == "<=":  rng["lte"] = value
-            return {"key": field, "range": rng}
-        if op == "in":
-            return {"key": field, "match": {"any": value}}
-        if op == "not_in":
-            return {"key": field, "match": {"except": value}}
-        if op == "contains":
-            return {"key": field, "match": {"value": value}}
-        if op == "contains_any":
-            return {"key": field, "match": {"any": value}}
-        if op == "contains_all":
-            return {"key": field, "match": {"all": value}}
-        if op == "!=":
-            return {"key": field, "match": {"value": value}}
-        if op == "is_empty":
-            return {"is_empty": {"key": field}}
-        if op == "is_null":
-            return {"is_null": {"key": field}}
-        if op == "text_match":
-            return {"key": field, "match": {"text": value}}
-        if op == "values_count":
-            return {"key": field, "values_count": value}
-
-        raise ValueError(f"Unsupported operator: {op}")
+        builder = _CONDITION_BUILDERS.get(op)
+        if builder is None:
+            raise ValueError(f"Unsupported operator: {op}")
+        return builder(self._model_class, key, val)
 
     def combined_vector_search(
         self,
@@ -615,57 +713,189 @@ class Query:
         query_vectors: Dict[str, List[float]],
         limit: int = 10,
         score_threshold: Optional[float] = None,
+        concurrent: bool = False,
+        quantization: bool = False,
+        oversampling: float = 3.0,
+        candidate_factor: float = 3.0,
+        fusion: str = "weighted",
     ) -> "Query":
-        """Perform a combined vector search across multiple vector fields with weights."""
+        """Perform a combined vector search across multiple vector fields with weights.
+
+        Each field is searched for ``limit * candidate_factor`` candidates before the
+        weighted scores are fused, so points that rank low on one field can still
+        make the top ``limit`` overall. This is separate from ``oversampling``, which
+        only applies inside Qdrant to quantized searches (see below).
+
+        By default all per-field searches go out in a single ``search_batch`` request.
+        With ``concurrent=True`` they are issued as separate searches in parallel through
+        an ``AsyncQdrantClient`` instead (cannot be used from inside a running event loop).
+
+        With ``quantization=True`` every per-field search asks the server to run the
+        oversampled first pass on quantized vectors and rescore with full precision,
+        using ``oversampling`` as Qdrant's quantization oversampling factor. Otherwise
+        each field's own ``VectorField`` quantization settings apply.
+
+        With ``fusion="rrf"`` each field contributes ``weight / (60 + rank)`` for its
+        1-based result rank instead of its weighted score (reciprocal rank fusion), so
+        fields whose scores are on different scales can still be combined.
+        """
+        if candidate_factor < 1:
+            raise ValueError("candidate_factor must be at least 1")
+        if fusion not in _FUSION_MODES:
+            raise ValueError(f"Unsupported fusion '{fusion}', expected one of {_FUSION_MODES}")
+        # Weights and vectors are fixed from here on, so normalize them once now
+        weights = {
+            self._vector_field_name(f): w
+            for f, w in vector_fields_with_weights.items()
+        }
+        total = sum(weights.values())
+        if total <= 0:
+            raise ValueError("Combined vector search weights must sum to a positive value")
+        missing = {f for f, w in weights.items() if w > 0} - query_vectors.keys()
+        if missing:
+            raise ValueError(f"Missing query vectors for fields: {sorted(missing)}")
         self._combined_search_params = {
             "vector_fields_with_weights": vector_fields_with_weights,
-            "query_vectors": query_vectors,
+            "normalized": {
+                f: w / total for f, w in weights.items() if w > 0
+            },
+            # Converted once per search; Qdrant normalizes Cosine queries itself
+            "query_vectors": {name: _prep_query(qv) for name, qv in query_vectors.items()},
             "limit": limit,
             "score_threshold": score_threshold,
+            "concurrent": concurrent,
+            "quantization": quantization,
+            "oversampling": oversampling,
+            "candidate_factor": candidate_factor,
+            "fusion": fusion,
         }
         return self
 
-    def _execute_combined_vector_search(self) -> List[Tuple[Any, float]]:
+    def _build_combined_search_requests(self) -> List[Tuple[str, float, SearchRequest]]:
+        """Build one search request per weighted vector field of the combined search."""
         params = self._combined_search_params
+        qfilter = self._build_qdrant_filter()
+        forced_quant_params = None
+        if params.get("quantization"):
+            forced_quant_params = SearchParams(
+                quantization=QuantizationSearchParams(
+                    ignore=False, rescore=True, oversampling=params["oversampling"]
+                )
+            )
+        requests = []
+        for fname, weight in params["normalized"].items():
+            qv = params["query_vectors"][fname]
+            request: Dict[str, Any] = {
+                "vector": NamedVector(name=fname, vector=qv.tolist()),
+                "limit": math.ceil(params["limit"] * params["candidate_factor"]),
+                "with_payload": False,
+                "with_vector": False,
+            }
+            if params["score_threshold"] is not None:
+                request["score_threshold"] = params["score_threshold"]
+            if qfilter:
+                request["filter"] = qfilter
+            quant_params = forced_quant_params or self._quantization_search_params(fname)
+            if quant_params is not None:
+                request["params"] = quant_params
+            requests.append((fname, weight, SearchRequest(**request)))
+        return requests
+
+    def _execute_combined_vector_search(self) -> List[Tuple[Any, float]]:
         client = self._session._get_client()
         collection_name = self._model_class.__collection__
-        # Normalize weights
-        weights = {
-            (f.name if isinstance(f, VectorField) else f): w
-            for f, w in params["vector_fields_with_weights"].items()
-        }
-        total = sum(weights.values())
-        normalized = {f: w/total for f, w in weights.items()}
-        all_scores: Dict[Any, float] = {}
-        for fname, weight in normalized.items():
-            if weight <= 0 or fname not in params["query_vectors"]:
-                continue
-            qv = params["query_vectors"][fname]
-            nv = NamedVector(name=fname, vector=qv)
+        requests = self._build_combined_search_requests()
+        if not requests:
+            return []
+        try:
+            # One round trip for all vector fields
+            batched = client.search_batch(
+                collection_name=collection_name,
+                requests=[request for _, _, request in requests],
+            )
+        except Exception:
+            logger.exception("Error during combined vector search")
+            return []
+        return self._fuse_combined_scores(requests, batched)
+
+    async def _execute_combined_vector_search_async(self) -> List[Tuple[Any, float]]:
+        """Run the per-field searches of a combined search concurrently."""
+        aclient = self._session._get_async_client()
+        collection_name = self._model_class.__collection__
+        requests = self._build_combined_search_requests()
+        if not requests:
+            return []
+        coros = []
+        for _, _, request in requests:
             sp: Dict[str, Any] = {
                 "collection_name": collection_name,
-                "limit": params["limit"] * 3,
+                "query_vector": request.vector,
+                "limit": request.limit,
                 "with_payload": False,
                 "with_vectors": False,
-                "query_vector": nv,
             }
-            if params["score_threshold"] is not None:
-                sp["score_threshold"] = params["score_threshold"]
-            if self._build_qdrant_filter():
-                sp["query_filter"] = self._build_qdrant_filter()
-            try:
-                res = client.search(**sp)
-                for pt in res:
-                    pid = pt.id
-                    all_scores[pid] = all_scores.get(pid, 0.0) + pt.score * weight
-            except Exception as e:
-                print(f"Error during vector search for {fname}: {e}")
-        # Sort & limit
-        sorted_pts = sorted(all_scores.items(), key=lambda x: x[1], reverse=True)
-        return sorted_pts[: params["limit"]]
+            if request.score_threshold is not None:
+                sp["score_threshold"] = request.score_threshold
+            if request.filter:
+                sp["query_filter"] = request.filter
+            if request.params is not None:
+                sp["search_params"] = request.params
+            coros.append(aclient.search(**sp))
+        try:
+            results = await asyncio.gather(*coros)
+        except Exception:
+            logger.exception("Error during concurrent combined vector search")
+            return []
+        return self._fuse_combined_scores(requests, results)
+
+    def _execute_combined_vector_search_concurrent(self) -> List[Tuple[Any, float]]:
+        """Synchronous wrapper around the concurrent combined search."""
+        return asyncio.run(self._execute_combined_vector_search_async())
+
+    def _fuse_combined_scores(self, requests, results) -> List[Tuple[Any, float]]:
+        """Sum weighted per-field scores (or reciprocal ranks) and return the top (id, score) pairs."""
+        limit = self._combined_search_params["limit"]
+        # Point ids may mix ints and UUID strings, so give each a dense row
+        # number (in first-seen order) in an (ids, fields) score matrix
+        id_to_row: Dict[Any, int] = {}
+        field_rows = []
+        for _, res in zip(requests, results):
+            rows = [id_to_row.setdefault(pt.id, len(id_to_row)) for pt in (res or ())]
+            field_rows.append((rows, res))
+        if not id_to_row or limit <= 0:
+            return []
+        rrf = self._combined_search_params["fusion"] == "rrf"
+        scores = np.zeros((len(id_to_row), len(field_rows)), dtype=np.float32)
+        for col, (rows, res) in enumerate(field_rows):
+            if not rows:
+                continue
+            if rrf:
+                # Results arrive best first, so a point's rank is its position
+                scores[rows, col] = 1.0 / (_RRF_K + np.arange(1, len(rows) + 1, dtype=np.float32))
+            else:
+                scores[rows, col] = np.fromiter(
+                    (pt.score for pt in res), dtype=np.float32, count=len(rows)
+                )
+        weights = np.fromiter(
+            (weight for _, weight, _ in requests), dtype=np.float32, count=len(field_rows)
+        )
+        fused = scores @ weights
+        # Top-K without sorting every candidate
+        if limit < len(fused):
+            top = np.argpartition(-fused, limit - 1)[:limit]
+        else:
+            top = np.arange(len(fused))
+        # Highest score first; ties keep first-seen order like a stable sort
+        top = np.sort(top)
+        top = top[np.argsort(-fused[top], kind="stable")]
+        ids = list(id_to_row)
+        return [(ids[i], float(fused[i])) for i in top.tolist()]
 
     def _get_combined_search_results(self) -> List[Base]:
-        combined = self._execute_combined_vector_search()
+        if self._combined_search_params.get("concurrent"):
+            combined = self._execute_combined_vector_search_concurrent()
+        else:
+            combined = self._execute_combined_vector_search()
         if not combined:
             return []
         client = self._session._get_client()
@@ -678,10 +908,12 @@ class Query:
                 with_payload=self._with_payload,
                 with_vectors=self._with_vectors,
             )
-            id_map = {str(pt.id): pt for pt in points}
-            ordered = [id_map.get(str(pid)) for pid, _ in combined]
-            return [self._session._point_to_model(pt, self._model_class) for pt in ordered if pt]
-        except Exception as e:
-            print(f"Error retrieving combined search results: {e}")
+            # Restore fused-score order; retrieve() does not preserve the input order
+            pos = {pid: i for i, pid in enumerate(ids)}
+            ordered = sorted((pt for pt in points if pt.id in pos), key=lambda pt: pos[pt.id])
+            # Same conversion as every other query path, so validation and ID mapping match
+            return [self._session._point_to_model(pt, self._model_class) for pt in ordered]
+        except Exception:
+            logger.exception("Error retrieving combined search results")
             return []
 
@@ -7,6 +7,12 @@ from typing import List, Optional, Union, Any, Type, TypeVar, Generic
 class DataType:
     """Base class for all data types"""
     
+    __slots__ = ("nullable",)
+    
+    # Exact Python types whose values are all valid for this type (empty: no fast path).
+    # NumPy scalars are left out on purpose: the Qdrant client cannot serialize them.
+    bulk_types = frozenset()
+    
     def __init__(self, nullable: bool = True):
         self.nullable = nullable
     
@@ -16,6 +22,17 @@ class DataType:
             return self.nullable
         return True
     
+    def validate_bulk(self, values: List[Any]) -> bool:
+        """
+        Check a list of values with one C-level pass over their types
+        
+        Returns True only if every value is known to be valid. False means the
+        values could not be checked in bulk and must be validated one by one.
+        """
+        if not self.bulk_types:
+            return False
+        return set(map(type, values)) <= self.bulk_types
+    
     def to_qdrant_type(self) -> str:
         """Convert to Qdrant type name"""
         raise NotImplementedError("Subclasses must implement to_qdrant_type")
@@ -24,6 +41,8 @@ class DataType:
 class Array(DataType):
     """Array data type that wraps another data type"""
     
+    __slots__ = ("base_type",)
+    
     def __init__(self, base_type: DataType, nullable: bool = True):
         """
         Initialize an array type
@@ -37,16 +56,15 @@ class Array(DataType):
     
     def validate(self, value: Any) -> bool:
         """Validate that value is an array with elements of the base type"""
-        if not super().validate(value):
-            return False
-        
         if value is None:
-            return True
+            return self.nullable
         
         if not isinstance(value, list):
             return False
         
         # Validate each element in the array
+        if self.base_type.validate_bulk(value):
+            return True
         return all(self.base_type.validate(item) for item in value)
     
     def to_qdrant_type(self) -> str:
@@ -61,10 +79,12 @@ class Array(DataType):
 class String(DataType):
     """String data type"""
     
+    __slots__ = ()
+    
     def validate(self, value: Any) -> bool:
-        if not super().validate(value):
-            return False
-        return value is None or isinstance(value, str)
+        if value is None:
+            return self.nullable
+        return isinstance(value, str)
     
     def to_qdrant_type(self) -> str:
         return "keyword"
@@ -73,10 +93,15 @@ class String(DataType):
 class Integer(DataType):
     """Integer data type"""
     
+    __slots__ = ()
+    
+    # bool is a subclass of int, so boolean arrays are valid too
+    bulk_types = frozenset((int, bool))
+    
     def validate(self, value: Any) -> bool:
-        if not super().validate(value):
-            return False
-        return value is None or isinstance(value, int)
+        if value is None:
+            return self.nullable
+        return isinstance(value, int)
     
     def to_qdrant_type(self) -> str:
         return "integer"
@@ -85,10 +110,14 @@ class Integer(DataType):
 class Float(DataType):
     """Float data type"""
     
+    __slots__ = ()
+    
+    bulk_types = frozenset((int, float, bool))
+    
     def validate(self, value: Any) -> bool:
-        if not super().validate(value):
-            return False
-        return value is None or isinstance(value, (int, float))
+        if value is None:
+            return self.nullable
+        return isinstance(value, (int, float))
     
     def to_qdrant_type(self) -> str:
         return "float"
@@ -97,10 +126,12 @@ class Float(DataType):
 class Boolean(DataType):
     """Boolean data type"""
     
+    __slots__ = ()
+    
     def validate(self, value: Any) -> bool:
-        if not super().validate(value):
-            return False
-        return value is None or isinstance(value, bool)
+        if value is None:
+            return self.nullable
+        return isinstance(value, bool)
     
     def to_qdrant_type(self) -> str:
         return "bool"
@@ -109,20 +140,24 @@ class Boolean(DataType):
 class Vector(DataType):
     """Vector data type"""
     
+    __slots__ = ("dimensions", "distance")
+    
     def __init__(self, dimensions: int, distance: str = "Cosine", nullable: bool = True):
         super().__init__(nullable=nullable)
         self.dimensions = dimensions
         self.distance = distance
     
     def validate(self, value: Any) -> bool:
-        if not super().validate(value):
-            return False
         if value is None:
-            return True
+            return self.nullable
         if not isinstance(value, list):
             return False
         if len(value) != self.dimensions:
             return False
+        # One pass over the element types instead of an isinstance call per dimension
+        if set(map(type, value)) <= Float.bulk_types:
+            return True
+        # Subclasses of int or float get the same per-element check
         return all(isinstance(x, (int, float)) for x in value)
     
     def to_qdrant_type(self) -> str:
@@ -13,6 +13,9 @@ setup(
         "qdrant-client==1.15.0",
         "numpy>=1.21.0",
     ],
+    extras_require={
+        "test": ["pytest>=7", "pytest-xdist"],
+    },
     python_requires=">=3.7",
     classifiers=[
         "Development Status :: 3 - Alpha",
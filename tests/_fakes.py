@@ -0,0 +1,248 @@
+"""
+Hand-written test doubles for the Qdrant client
+"""
+import collections
+from types import SimpleNamespace
+
+import numpy as np
+from qdrant_client import QdrantClient
+from qdrant_client.http.models import (
+    Filter as QdrantFilter, FilterSelector, MatchAny, MatchExcept, MatchValue
+)
+
+
+# Attribute names of the real client for Mock(spec_set=CLIENT_SPEC), computed once so
+# each spec'd mock skips introspecting QdrantClient and rejects attributes it lacks
+CLIENT_SPEC = [name for name in dir(QdrantClient) if not name.startswith("_")]
+
+
+class RecordingQdrantClient:
+    """Plain stand-in for QdrantClient that records calls and returns canned results
+
+    Every client method appends ``(args, kwargs)`` to ``calls[name]`` and returns
+    ``return_values[name]`` when set, or an empty result of the right shape
+    otherwise; an exception set as the return value is raised instead. Unlike
+    ``MagicMock`` there is no attribute synthesis, so a typo in a method name
+    fails loudly.
+    """
+
+    def __init__(self, *args, **kwargs):
+        self.calls = collections.defaultdict(list)
+        self.return_values = {}
+
+    def reset(self):
+        """Forget recorded calls and configured return values"""
+        self.calls.clear()
+        self.return_values.clear()
+
+    def _record(self, name, args, kwargs, default=None):
+        self.calls[name].append((args, kwargs))
+        result = self.return_values.get(name, default)
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+    def get_collections(self, *args, **kwargs):
+        return self._record("get_collections", args, kwargs, SimpleNamespace(collections=[]))
+
+    def create_collection(self, *args, **kwargs):
+        return self._record("create_collection", args, kwargs)
+
+    def delete_collection(self, *args, **kwargs):
+        return self._record("delete_collection", args, kwargs)
+
+    def create_payload_index(self, *args, **kwargs):
+        return self._record("create_payload_index", args, kwargs)
+
+    def upsert(self, *args, **kwargs):
+        return self._record("upsert", args, kwargs)
+
+    def delete(self, *args, **kwargs):
+        return self._record("delete", args, kwargs)
+
+    def retrieve(self, *args, **kwargs):
+        return self._record("retrieve", args, kwargs, [])
+
+    def scroll(self, *args, **kwargs):
+        return self._record("scroll", args, kwargs, ([], None))
+
+    def count(self, *args, **kwargs):
+        return self._record("count", args, kwargs, SimpleNamespace(count=0))
+
+    def search(self, *args, **kwargs):
+        return self._record("search", args, kwargs, [])
+
+    def search_batch(self, *args, **kwargs):
+        requests = kwargs.get("requests", args[1] if len(args) > 1 else [])
+        return self._record("search_batch", args, kwargs, [[] for _ in requests])
+
+
+def _condition_matches(condition, payload):
+    """Check a single Qdrant condition against a point payload"""
+    if isinstance(condition, QdrantFilter):
+        return _filter_matches(condition, payload)
+
+    value = payload.get(condition.key)
+    values = value if isinstance(value, list) else [value]
+    match = condition.match
+    if isinstance(match, MatchValue):
+        return match.value in values
+    if isinstance(match, MatchAny):
+        return any(v in match.any for v in values)
+    if isinstance(match, MatchExcept):
+        return all(v not in match.except_ for v in values)
+
+    bounds = condition.range
+    if bounds is not None:
+        if value is None:
+            return False
+        return (
+            (bounds.gt is None or value > bounds.gt)
+            and (bounds.gte is None or value >= bounds.gte)
+            and (bounds.lt is None or value < bounds.lt)
+            and (bounds.lte is None or value <= bounds.lte)
+        )
+    raise NotImplementedError(f"FakeQdrantClient does not support condition {condition!r}")
+
+
+def _filter_matches(qfilter, payload):
+    """Check a Qdrant filter (must / must_not / should) against a point payload"""
+    if qfilter is None:
+        return True
+    if not all(_condition_matches(c, payload) for c in qfilter.must or []):
+        return False
+    if any(_condition_matches(c, payload) for c in qfilter.must_not or []):
+        return False
+    should = qfilter.should or []
+    return not should or any(_condition_matches(c, payload) for c in should)
+
+
+class FakeQdrantClient:
+    """In-process stand-in for QdrantClient backed by plain dicts
+
+    Collections map point ids to PointStruct objects. Filters are evaluated in
+    Python and vector search scores every stored point with NumPy, so tests run
+    without a Qdrant server.
+    """
+
+    def __init__(self, *args, **kwargs):
+        self._collections = {}
+        self._distances = {}
+
+    def _points(self, collection_name):
+        return self._collections.setdefault(collection_name, {})
+
+    @staticmethod
+    def _record(point, with_payload=True, with_vectors=False, score=None):
+        return SimpleNamespace(
+            id=point.id,
+            payload=dict(point.payload) if with_payload else {},
+            vector=point.vector if with_vectors else None,
+            score=score,
+        )
+
+    def get_collections(self):
+        return SimpleNamespace(collections=[SimpleNamespace(name=name) for name in self._collections])
+
+    def create_collection(self, collection_name, vectors_config=None, **kwargs):
+        self._collections[collection_name] = {}
+        self._distances[collection_name] = {
+            name: getattr(params.distance, "value", params.distance)
+            for name, params in (vectors_config or {}).items()
+        }
+
+    def delete_collection(self, collection_name, **kwargs):
+        self._collections.pop(collection_name, None)
+        self._distances.pop(collection_name, None)
+
+    def create_payload_index(self, *args, **kwargs):
+        pass
+
+    def upsert(self, collection_name, points, **kwargs):
+        store = self._points(collection_name)
+        for point in points:
+            store[point.id] = point
+
+    def delete(self, collection_name, points_selector, **kwargs):
+        store = self._points(collection_name)
+        if isinstance(points_selector, FilterSelector):
+            point_ids = [
+                point_id for point_id, point in store.items()
+                if _filter_matches(points_selector.filter, point.payload)
+            ]
+        else:
+            point_ids = points_selector.points
+        for point_id in point_ids:
+            store.pop(point_id, None)
+
+    def retrieve(self, collection_name, ids, with_payload=True, with_vectors=False, **kwargs):
+        store = self._points(collection_name)
+        return [
+            self._record(store[point_id], with_payload, with_vectors)
+            for point_id in ids if point_id in store
+        ]
+
+    def scroll(self, collection_name, scroll_filter=None, limit=10, offset=None,
+               with_payload=True, with_vectors=False, **kwargs):
+        matched = [
+            point for point in self._points(collection_name).values()
+            if _filter_matches(scroll_filter, point.payload)
+        ]
+        start = offset or 0
+        page = matched[start:start + limit]
+        next_offset = start + limit if start + limit < len(matched) else None
+        return [self._record(point, with_payload, with_vectors) for point in page], next_offset
+
+    def count(self, collection_name, count_filter=None, **kwargs):
+        return SimpleNamespace(count=sum(
+            1 for point in self._points(collection_name).values()
+            if _filter_matches(count_filter, point.payload)
+        ))
+
+    def search(self, collection_name, query_vector, query_filter=None, limit=10,
+               score_threshold=None, with_payload=True, with_vectors=False, **kwargs):
+        name = query_vector.name
+        candidates = [
+            point for point in self._points(collection_name).values()
+            if name in (point.vector or {}) and _filter_matches(query_filter, point.payload)
+        ]
+        if not candidates:
+            return []
+
+        # Score every candidate in one matrix-vector product
+        matrix = np.asarray([point.vector[name] for point in candidates], dtype=np.float32)
+        query = np.asarray(query_vector.vector, dtype=np.float32)
+        distance = self._distances.get(collection_name, {}).get(name, "Cosine")
+        if distance == "Euclid":
+            # Negated so that higher is still better when ranking
+            scores = -np.linalg.norm(matrix - query, axis=1)
+        else:
+            scores = matrix @ query
+            if distance == "Cosine":
+                norms = np.linalg.norm(matrix, axis=1) * np.linalg.norm(query)
+                scores = np.divide(scores, norms, out=np.zeros_like(scores), where=norms > 0)
+
+        order = np.argsort(-scores, kind="stable")
+        results = []
+        for i in order.tolist():
+            score = float(scores[i])
+            if score_threshold is not None and score < score_threshold:
+                break
+            results.append(self._record(candidates[i], with_payload, with_vectors, score))
+            if len(results) == limit:
+                break
+        return results
+
+    def search_batch(self, collection_name, requests, **kwargs):
+        return [
+            self.search(
+                collection_name,
+                query_vector=request.vector,
+                query_filter=request.filter,
+                limit=request.limit,
+                score_threshold=request.score_threshold,
+                with_payload=request.with_payload,
+                with_vectors=request.with_vector,
+            )
+            for request in requests
+        ]
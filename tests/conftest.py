@@ -0,0 +1,27 @@
+"""
+Shared fixtures for the Qdrant ORM test suite
+"""
+import pytest
+
+from qdrant_orm import QdrantEngine, QdrantSession
+
+from _fakes import RecordingQdrantClient
+
+
+@pytest.fixture(scope="module")
+def engine():
+    """Engine on a RecordingQdrantClient, built once per test module"""
+    return QdrantEngine.from_client(RecordingQdrantClient())
+
+
+@pytest.fixture
+def session(engine):
+    """Fresh session on the shared engine; sessions hold pending changes and id mappings"""
+    return QdrantSession(engine)
+
+
+@pytest.fixture
+def fake_client(engine):
+    """The engine's RecordingQdrantClient, with calls and return values reset"""
+    engine.client.reset()
+    return engine.client
@@ -0,0 +1,54 @@
+"""
+Test models shared across the Qdrant ORM test suite
+
+Each model is defined once here, so the Base metaclass builds its field map
+once per session instead of once per test module.
+"""
+from qdrant_orm import (
+    Base, Field, VectorField,
+    String, Float, Boolean
+)
+
+
+class SharedTestDocument(Base):
+    """Test document model"""
+
+    __collection__ = "test_documents"
+
+    id = Field(String, primary_key=True)
+    title = Field(String)
+    content = Field(String, nullable=True)
+    score = Field(Float, default=0.0)
+    is_active = Field(Boolean, default=True)
+    embedding = VectorField(dimensions=4)  # Small dimension for testing
+
+
+class Document(Base):
+    """Document model with multiple vector fields"""
+
+    __collection__ = "documents"
+
+    id = Field(String, primary_key=True)
+    title = Field(String)
+    content = Field(String)
+    rating = Field(Float)
+    image_embedding = VectorField(dimensions=512)
+    text_embedding = VectorField(dimensions=384)
+    embedding = VectorField(dimensions=128)
+
+
+class Item(Base):
+    """Item model whose collection is shared with ImageItem"""
+
+    __collection__ = "items"
+
+    id = Field(String, primary_key=True)
+    emb = VectorField(dimensions=2)
+
+
+class ImageItem(Item):
+    """Item subclass adding a second vector field in the same collection"""
+
+    __collection__ = "items"
+
+    img = VectorField(dimensions=2)
@@ -1,9 +1,6 @@
 import unittest
-import sys
-import os
 
-# Add the parent directory to the path so we can import the qdrant_orm package
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import numpy as np
 
 from qdrant_orm.base import Base, Field, ArrayField
 from qdrant_orm.types import String, Integer, Float, Boolean, Array
@@ -90,6 +87,68 @@ class TestArrayField(unittest.TestCase):
         with self.assertRaises(ValueError):
             instance.numbers = [1, "two", 3]  # Contains non-integer
 
+    def test_large_array_validation(self):
+        """Test that large numeric arrays are validated correctly"""
+        class TestModel(Base):
+            __collection__ = "test_collection"
+
+            id = Field(field_type=String(), primary_key=True)
+            numbers = ArrayField(field_type=Integer())
+            scores = ArrayField(field_type=Float())
+
+        instance = TestModel(id="test1")
+
+        # Large valid arrays
+        instance.numbers = list(range(1000))
+        instance.scores = [i * 0.5 for i in range(1000)]
+        self.assertEqual(len(instance.numbers), 1000)
+        self.assertEqual(len(instance.scores), 1000)
+
+        # Integers are valid floats, but floats are not valid integers
+        instance.scores = list(range(1000))
+        with self.assertRaises(ValueError):
+            instance.numbers = list(range(999)) + [1.5]
+
+        # Mixed and nested values fall back to per-element validation
+        with self.assertRaises(ValueError):
+            instance.numbers = list(range(999)) + ["1000"]
+        with self.assertRaises(ValueError):
+            instance.numbers = [[1, 2]] * 100
+
+        # Array type validation uses the same fast path
+        self.assertTrue(Array(Integer()).validate(list(range(1000))))
+        self.assertFalse(Array(Integer()).validate(list(range(999)) + [None, 2.5]))
+
+    def test_numpy_scalars_rejected(self):
+        """Test that NumPy scalars are rejected for short and long lists alike"""
+        for n in (3, 40):
+            with self.subTest(n=n):
+                self.assertTrue(Array(Integer()).validate(list(range(n))))
+                self.assertTrue(Array(Float()).validate([0.5] * (n - 1) + [True]))
+                self.assertFalse(Array(Integer()).validate(list(np.arange(n))))
+                self.assertFalse(Array(Float()).validate([np.float32(i) for i in range(n)]))
+                self.assertFalse(Array(Integer()).validate([0.5] * n))
+
+        class TestModel(Base):
+            __collection__ = "test_collection"
+
+            id = Field(field_type=String(), primary_key=True)
+            numbers = ArrayField(field_type=Integer())
+
+        # NumPy scalars would be stored as is and fail to serialize on commit
+        instance = TestModel(id="test1")
+        for value in ([np.int64(1)] * 3, list(np.arange(40))):
+            with self.assertRaises(ValueError):
+                instance.numbers = value
+
+    def test_element_type_nullable(self):
+        """Test that element types honour their own nullable flag"""
+        self.assertTrue(Integer().validate(None))
+        self.assertFalse(Integer(nullable=False).validate(None))
+        self.assertFalse(Array(String(), nullable=False).validate(None))
+        self.assertTrue(Array(String(nullable=True)).validate(["a", None]))
+        self.assertFalse(Array(String(nullable=False)).validate(["a", None]))
+
     def test_array_field_nullable(self):
         """Test that ArrayField can be nullable"""
         # Create a model with nullable and non-nullable array fields
@@ -0,0 +1,89 @@
+"""
+Test for batching first() across many queries in Qdrant ORM
+"""
+import unittest
+
+from qdrant_orm import (
+    Base, Field, VectorField,
+    QdrantEngine, QdrantSession,
+    String
+)
+from qdrant_orm.query import Query
+
+from _fakes import RecordingQdrantClient
+
+
+# Define test model
+class BatchDocument(Base):
+    """Test document model with a dense vector"""
+
+    __collection__ = "batch_documents"
+
+    id = Field(String, primary_key=True)
+    title = Field(String)
+    embedding = VectorField(dimensions=3)
+
+
+class MockPoint:
+    """Mock Qdrant point for testing"""
+
+    __slots__ = ("id", "payload", "vector", "score")
+
+    def __init__(self, id, payload, score=None):
+        self.id = id
+        self.payload = payload
+        self.vector = None
+        self.score = score
+
+
+class TestBatchFirst(unittest.TestCase):
+    """Test case for Query.batch_first"""
+
+    def setUp(self):
+        """Set up test environment"""
+        self.mock_client = RecordingQdrantClient()
+
+        self.engine = QdrantEngine.from_client(self.mock_client)
+        self.session = QdrantSession(self.engine)
+
+    def test_vector_queries_share_one_batch(self):
+        """Test that vector queries go out in a single search_batch call"""
+        self.mock_client.return_values["search_batch"] = [
+            [MockPoint("doc1", {"title": "First"}, 0.9)],
+            [],
+            [MockPoint("doc2", {"title": "Second"}, 0.8), MockPoint("doc3", {"title": "Third"}, 0.7)],
+        ]
+        self.mock_client.return_values["scroll"] = ([MockPoint("doc4", {"title": "Fourth"})], None)
+
+        queries = [
+            self.session.query(BatchDocument).vector_search(BatchDocument.embedding, [0.1, 0.2, 0.3]),
+            self.session.query(BatchDocument).vector_search(BatchDocument.embedding, [0.3, 0.2, 0.1]),
+            self.session.query(BatchDocument).filter(BatchDocument.title == "Fourth"),
+            self.session.query(BatchDocument).vector_search(BatchDocument.embedding, [0.2, 0.2, 0.2]).offset(1),
+        ]
+        results = Query.batch_first(queries)
+
+        ((_, call_kwargs),) = self.mock_client.calls["search_batch"]
+        self.assertEqual(self.mock_client.calls["search"], [])
+        requests = call_kwargs["requests"]
+        self.assertEqual([r.limit for r in requests], [1, 1, 2])
+
+        # Results stay in input order; the scroll query falls back to first()
+        self.assertEqual(results[0].id, "doc1")
+        self.assertIsNone(results[1])
+        self.assertEqual(results[2].id, "doc4")
+        self.assertEqual(results[3].id, "doc3")
+
+    def test_batch_error_returns_none(self):
+        """Test that a failed batch leaves its queries without a result"""
+        self.mock_client.return_values["search_batch"] = Exception("boom")
+
+        results = Query.batch_first([
+            self.session.query(BatchDocument).vector_search(BatchDocument.embedding, [0.1, 0.2, 0.3])
+        ])
+
+        self.assertEqual(results, [None])
+
+
+if __name__ == "__main__":
+    unittest.main()
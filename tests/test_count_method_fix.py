@@ -1,10 +1,5 @@
 import unittest
 from unittest.mock import MagicMock, patch
-import sys
-import os
-
-# Add the parent directory to the path so we can import the qdrant_orm package
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from qdrant_orm.base import Base, Field, VectorField
 from qdrant_orm.query import Query
@@ -0,0 +1,91 @@
+"""
+Test for converting filters and nested filter groups to Qdrant filters
+"""
+import unittest
+from unittest.mock import MagicMock
+
+from qdrant_orm.query import Query
+from qdrant_orm.filters import Filter, FilterGroup
+
+
+class TestFilterConversion(unittest.TestCase):
+    """Test case for Query._build_qdrant_filter with single filters and nested groups"""
+
+    def setUp(self):
+        """Set up test environment"""
+        self.query = Query(MagicMock(), MagicMock())
+
+    def test_operator_conversion(self):
+        """Test that single filters are converted per operator"""
+        price, tag_a, tag_b, discount = self.query.filter(
+            Filter("price", ">=", 10),
+            Filter("tags", "contains_all", ["a", "b"]),
+            Filter("discount", "is_null", True),
+        )._build_qdrant_filter().must
+
+        self.assertEqual((price.key, price.range.gte), ("price", 10))
+        self.assertEqual([tag.match.value for tag in (tag_a, tag_b)], ["a", "b"])
+        self.assertEqual(discount.is_null.key, "discount")
+
+    def test_unsupported_operator(self):
+        """Test that unknown operators raise ValueError"""
+        with self.assertRaises(ValueError):
+            self.query.filter(Filter("price", "between", (1, 2)))._build_qdrant_filter()
+
+    def test_nested_group_conversion(self):
+        """Test that nested groups keep their structure and child order"""
+        group = (Filter("title", "==", "Doc") | Filter("rating", ">", 4.0)) & Filter("tags", "contains", "x")
+
+        sub, tags = self.query.filter(group)._build_qdrant_filter().must
+        title, rating = sub.should
+        self.assertEqual((title.key, title.match.value), ("title", "Doc"))
+        self.assertEqual((rating.key, rating.range.gt), ("rating", 4.0))
+        self.assertEqual((tags.key, tags.match.value), ("tags", "x"))
+
+    def test_nested_group_in_search_filter(self):
+        """Test that groups nested in a group become Qdrant sub-filters"""
+        nested = Filter("rating", ">", 4.0) | Filter("title", "!=", "Draft")
+        qfilter = self.query.filter(FilterGroup("and", [Filter("title", "==", "Doc"), nested]))._build_qdrant_filter()
+
+        title, sub = qfilter.must
+        self.assertEqual(title.key, "title")
+        rating, negated = sub.should
+        self.assertEqual(rating.range.gt, 4.0)
+        self.assertEqual(negated.must_not[0].match.value, "Draft")
+
+    def test_deeply_nested_search_filter(self):
+        """Test that deep nesting in search filters does not hit the recursion limit"""
+        group = Filter("depth", "==", 0)
+        for i in range(5000):
+            group = FilterGroup("and", [group, Filter("depth", "<", i)])
+
+        qfilter = self.query.filter(FilterGroup("and", [group]))._build_qdrant_filter()
+        (sub,) = qfilter.must
+        self.assertEqual(sub.must[1].range.lt, 4999)
+
+    def test_group_same_at_top_level_and_nested(self):
+        """Test that a group converts the same whether or not it is nested"""
+        group = Filter("rating", "!=", 1) & Filter("title", "==", "Doc")
+        top = self.query.filter(group)._build_qdrant_filter()
+        (nested,) = Query(MagicMock(), MagicMock()).filter(FilterGroup("and", [group]))._build_qdrant_filter().must
+
+        for qfilter in (top, nested):
+            self.assertEqual([c.key for c in qfilter.must], ["title"])
+            self.assertEqual([c.match.value for c in qfilter.must_not], [1])
+
+    def test_top_level_or_groups_stay_separate(self):
+        """Test that several OR groups must each be satisfied"""
+        qfilter = self.query.filter(
+            Filter("title", "==", "a") | Filter("title", "==", "b"),
+            Filter("rating", ">", 1) | Filter("rating", "<", 0),
+        )._build_qdrant_filter()
+
+        self.assertEqual(qfilter.should, [])
+        first, second = qfilter.must
+        self.assertEqual([c.match.value for c in first.should], ["a", "b"])
+        self.assertEqual([c.range.gt for c in second.should], [1, None])
+
+
+
+if __name__ == "__main__":
+    unittest.main()
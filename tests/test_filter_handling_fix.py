@@ -4,28 +4,29 @@ Test file to verify the filter handling fix in the Qdrant ORM framework.
 This test ensures that filters are properly converted to the format expected by Qdrant.
 """
 import unittest
-from unittest.mock import patch, MagicMock
 
 from qdrant_client.http.models import Filter as QdrantFilter
 
 from qdrant_orm import (
-    Base, Field, VectorField, 
+    Base, Field, ArrayField, VectorField,
     QdrantEngine, QdrantSession,
-    String, Integer, Float, Boolean, Vector
+    String, Float
 )
 from qdrant_orm.filters import Filter, FilterGroup
 
+from _fakes import RecordingQdrantClient
+
 
 # Define a test model
 class TestDocument(Base):
     """Test document model"""
     
-    __collection__ = "test_documents"
+    __collection__ = "filter_documents"
     
     id = Field(String, primary_key=True)
     title = Field(String)
     rating = Field(Float)
-    tags = Field(String, is_array=True)
+    tags = ArrayField(String)
     embedding = VectorField(dimensions=128)
 
 
@@ -34,14 +35,11 @@ class TestFilterHandlingFix(unittest.TestCase):
     
     def setUp(self):
         """Set up test environment"""
-        # Create a mock engine and session
-        self.engine = MagicMock()
+        # Mock the client and build the engine and session around it
+        self.mock_client = RecordingQdrantClient()
+        self.engine = QdrantEngine.from_client(self.mock_client)
         self.session = QdrantSession(self.engine)
         
-        # Mock the client
-        self.mock_client = MagicMock()
-        self.session._get_client = MagicMock(return_value=self.mock_client)
-        
         # Create a query object
         self.query = self.session.query(TestDocument)
 
@@ -65,8 +63,8 @@ class TestFilterHandlingFix(unittest.TestCase):
         
         # Verify the filter condition
         condition = qdrant_filter.must[0]
-        self.assertEqual(condition["key"], "title")
-        self.assertEqual(condition["match"]["value"], "Test Document")
+        self.assertEqual(condition.key, "title")
+        self.assertEqual(condition.match.value, "Test Document")
 
     def test_multiple_filters_conversion(self):
         """Test that multiple filters are properly combined with AND logic"""
@@ -89,13 +87,13 @@ class TestFilterHandlingFix(unittest.TestCase):
         
         # Verify the first filter condition
         condition1 = qdrant_filter.must[0]
-        self.assertEqual(condition1["key"], "title")
-        self.assertEqual(condition1["match"]["value"], "Test Document")
+        self.assertEqual(condition1.key, "title")
+        self.assertEqual(condition1.match.value, "Test Document")
         
         # Verify the second filter condition
         condition2 = qdrant_filter.must[1]
-        self.assertEqual(condition2["key"], "rating")
-        self.assertEqual(condition2["range"]["gt"], 4.0)
+        self.assertEqual(condition2.key, "rating")
+        self.assertEqual(condition2.range.gt, 4.0)
 
     def test_filter_group_conversion(self):
         """Test that filter groups are properly converted to Qdrant format"""
@@ -115,24 +113,19 @@ class TestFilterHandlingFix(unittest.TestCase):
         # Verify that the result is a QdrantFilter object
         self.assertIsInstance(qdrant_filter, QdrantFilter)
         
-        # Verify that the filter has the correct structure
-        self.assertTrue(hasattr(qdrant_filter, "must"))
-        self.assertEqual(len(qdrant_filter.must), 1)
-        
-        # Verify the filter group condition
-        condition = qdrant_filter.must[0]
-        self.assertTrue("should" in condition)
-        self.assertEqual(len(condition["should"]), 2)
+        # Verify that the OR group's conditions become should clauses
+        self.assertEqual(qdrant_filter.must, [])
+        self.assertEqual(len(qdrant_filter.should), 2)
         
         # Verify the first condition in the group
-        subcondition1 = condition["should"][0]
-        self.assertEqual(subcondition1["key"], "title")
-        self.assertEqual(subcondition1["match"]["value"], "Test Document")
+        subcondition1 = qdrant_filter.should[0]
+        self.assertEqual(subcondition1.key, "title")
+        self.assertEqual(subcondition1.match.value, "Test Document")
         
         # Verify the second condition in the group
-        subcondition2 = condition["should"][1]
-        self.assertEqual(subcondition2["key"], "rating")
-        self.assertEqual(subcondition2["range"]["gt"], 4.0)
+        subcondition2 = qdrant_filter.should[1]
+        self.assertEqual(subcondition2.key, "rating")
+        self.assertEqual(subcondition2.range.gt, 4.0)
 
     def test_array_field_filter_conversion(self):
         """Test that array field filters are properly converted to Qdrant format"""
@@ -154,8 +147,8 @@ class TestFilterHandlingFix(unittest.TestCase):
         
         # Verify the filter condition
         condition = qdrant_filter.must[0]
-        self.assertEqual(condition["key"], "tags")
-        self.assertEqual(condition["match"]["value"], "python")
+        self.assertEqual(condition.key, "tags")
+        self.assertEqual(condition.match.value, "python")
 
 
 if __name__ == '__main__':
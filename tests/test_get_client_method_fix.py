@@ -5,24 +5,33 @@ This test ensures that the _get_client method is properly implemented
 and returns the client attribute of the QdrantSession object.
 """
 import unittest
-from unittest.mock import patch, MagicMock
+from unittest.mock import patch, MagicMock, Mock
 
 from qdrant_orm import (
-    Base, Field, VectorField, 
+    Base, Field,
     QdrantEngine, QdrantSession,
-    String, Integer, Float, Boolean, Vector
+    String
 )
 
+from _fakes import CLIENT_SPEC
+
 
 class TestGetClientMethodFix(unittest.TestCase):
     """Test case for the _get_client method fix in QdrantSession"""
     
+    @classmethod
+    def setUpClass(cls):
+        """Create the mock engine and client once for all tests"""
+        # Create a mock engine
+        cls.engine = MagicMock()
+        cls.mock_client = Mock(spec_set=CLIENT_SPEC)
+        cls.engine.get_client.return_value = cls.mock_client
+    
     def setUp(self):
         """Set up test environment"""
-        # Create a mock engine
-        self.engine = MagicMock()
-        self.mock_client = MagicMock()
-        self.engine.get_client.return_value = self.mock_client
+        # Clear recorded calls but keep configured return values
+        self.engine.reset_mock(return_value=False, side_effect=False)
+        self.mock_client.reset_mock(return_value=False, side_effect=False)
         
         # Create a session with the mock engine
         self.session = QdrantSession(self.engine)
@@ -57,6 +66,20 @@ class TestGetClientMethodFix(unittest.TestCase):
             
             # Verify that Query was called with the session and model
             MockQuery.assert_called_once_with(self.session, TestModel)
+    
+    def test_engine_from_client(self):
+        """Test that an engine built from an existing client uses that client"""
+        engine = QdrantEngine.from_client(self.mock_client)
+        self.assertIs(engine.get_client(), self.mock_client)
+        self.assertIs(QdrantSession(engine)._get_client(), self.mock_client)
+        
+        # No connection settings to derive an async client from
+        with self.assertRaises(ValueError):
+            engine.get_async_client()
+        
+        async_client = Mock()
+        engine = QdrantEngine.from_client(self.mock_client, async_client=async_client)
+        self.assertIs(engine.get_async_client(), async_client)
 
 
 if __name__ == '__main__':
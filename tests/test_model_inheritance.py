@@ -0,0 +1,79 @@
+"""
+Tests for fields inherited by model subclasses
+"""
+from qdrant_orm.base import Base, Field
+from qdrant_orm.types import Integer, String
+
+
+class Parent(Base):
+    __collection__ = "inheritance_parent"
+
+    id = Field(String(), primary_key=True)
+    x = Field(Integer(), default=1)
+
+
+class Child(Parent):
+    y = Field(Integer())
+
+
+class Override(Parent):
+    x = Field(String(), default="x")
+
+
+class Left(Base):
+    __collection__ = "inheritance_left"
+
+    a = Field(Integer())
+
+
+class Right(Base):
+    __collection__ = "inheritance_right"
+
+    b = Field(Integer())
+
+
+class Both(Left, Right):
+    c = Field(Integer())
+
+
+def test_single_inheritance_reuses_parent_fields():
+    """Test that a subclass reuses the parent's descriptors"""
+    assert Child._fields["x"] is Parent._fields["x"]
+    assert list(Child._fields) == ["y", "id", "x"]
+
+    child = Child(id="c1", y=2)
+    assert (child.id, child.x, child.y) == ("c1", 1, 2)
+    assert Parent.x.__get__(child, Child) == 1
+    assert child.to_dict() == {"id": "c1", "x": 1, "y": 2}
+    # Values live in the instance's _values dict
+    child._values["y"] = 3
+    assert child.y == 3
+
+
+def test_overridden_field_replaces_parent_field():
+    """Test that a field redefined in a subclass gets its own descriptor"""
+    assert Override._fields["x"] is not Parent._fields["x"]
+    assert sorted(Override._fields) == ["id", "x"]
+
+    obj = Override(id="o1")
+    assert obj.x == "x"
+    obj.x = "changed"
+    assert obj.to_dict() == {"id": "o1", "x": "changed"}
+    # The parent's instances are unaffected
+    assert Parent(id="p1").x == 1
+
+
+def test_multiple_inheritance_collects_fields_of_both_bases():
+    """Test that a subclass of two models has the fields of both"""
+    assert sorted(Both._fields) == ["a", "b", "c"]
+
+    obj = Both(a=1, b=2, c=3)
+    assert (obj.a, obj.b, obj.c) == (1, 2, 3)
+    assert obj.to_dict() == {"a": 1, "b": 2, "c": 3}
+    # Each base's own descriptor reads the subclass instance
+    assert Left.a.__get__(obj, Both) == 1
+    assert Right.b.__get__(obj, Both) == 2
+    Right.b.__set__(obj, 5)
+    assert (obj.a, obj.b) == (1, 5)
+    # ... and keeps working on Right instances
+    assert Right(b=7).b == 7
@@ -6,56 +6,55 @@ This test ensures that:
 2. The vector_search method accepts both 'vector' and 'query_vector' parameters
 """
 import unittest
-from unittest.mock import patch, MagicMock
+from types import SimpleNamespace
+from unittest.mock import Mock
 
-from qdrant_orm import (
-    Base, Field, VectorField, 
-    QdrantEngine, QdrantSession,
-    String, Integer, Float, Boolean, Vector
-)
+from qdrant_orm import QdrantEngine, QdrantSession
 
+from _fakes import CLIENT_SPEC
+from models import SharedTestDocument as TestDocument
 
-# Define a test model
-class TestDocument(Base):
-    """Test document model"""
-    
-    __collection__ = "test_documents"
+# Model returned for every search hit; the tests only check ids, so one
+# prebuilt instance replaces per-call point conversion
+_SEARCH_DOC = TestDocument(id="doc1", title="Test Document")
+
+
+class _StubSession(QdrantSession):
+    """Session that maps every search hit to _SEARCH_DOC"""
     
-    id = Field(String, primary_key=True)
-    title = Field(String)
-    embedding = VectorField(dimensions=128)
+    def _point_to_model(self, point, model_class):
+        return _SEARCH_DOC
 
 
 class TestParameterFix(unittest.TestCase):
     """Test case for the parameter order and naming fixes"""
     
-    def setUp(self):
-        """Set up test environment"""
-        # Create a mock engine and session
-        self.engine = MagicMock()
-        self.session = QdrantSession(self.engine)
-        
-        # Mock the client
-        self.mock_client = MagicMock()
-        self.session._get_client = MagicMock(return_value=self.mock_client)
+    @classmethod
+    def setUpClass(cls):
+        """Create the mock client, engine and session once for all tests"""
+        # Mock the client and build the engine and session around it
+        cls.mock_client = Mock(spec_set=CLIENT_SPEC)
+        cls.engine = QdrantEngine.from_client(cls.mock_client)
+        cls.session = _StubSession(cls.engine)
         
         # Mock search results
-        self.mock_search_result = MagicMock()
-        self.mock_search_result.id = "doc1"
-        self.mock_search_result.score = 0.95
-        self.mock_search_result.payload = {"id": "doc1", "title": "Test Document"}
+        cls.mock_search_result = SimpleNamespace(
+            id="doc1",
+            score=0.95,
+            payload={"id": "doc1", "title": "Test Document"},
+            vector=None
+        )
         
         # Mock the search method to return our mock result
-        self.mock_client.search.return_value = [self.mock_search_result]
-        
-        # Mock the point_to_model method
-        self.session._point_to_model = MagicMock(return_value=TestDocument(
-            id="doc1", 
-            title="Test Document"
-        ))
+        cls.mock_client.search.return_value = [cls.mock_search_result]
         
         # Create test vector
-        self.test_vector = [0.1] * 128
+        cls.test_vector = [0.1] * 4
+    
+    def setUp(self):
+        """Set up test environment"""
+        # Clear recorded calls but keep configured return values
+        self.mock_client.reset_mock(return_value=False, side_effect=False)
 
     def test_query_parameter_order(self):
         """Test that the Query class correctly handles the session and model_class parameters"""
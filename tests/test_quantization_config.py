@@ -0,0 +1,101 @@
+"""
+Test for quantization settings on vector fields in Qdrant ORM
+"""
+import unittest
+
+from qdrant_client.http import models as qmodels
+
+from qdrant_orm import (
+    Base, Field, VectorField,
+    QdrantEngine, QdrantSession,
+    String
+)
+
+from _fakes import RecordingQdrantClient
+
+
+# Define test model
+class QuantizedDocument(Base):
+    """Test document model with quantized vectors"""
+
+    __collection__ = "quantized_documents"
+
+    id = Field(String, primary_key=True)
+    title = Field(String)
+    image_embedding = VectorField(dimensions=4, quantization="binary", oversampling=2.0)
+    text_embedding = VectorField(dimensions=3)
+
+
+class TestQuantizationConfig(unittest.TestCase):
+    """Test case for vector field quantization"""
+
+    def setUp(self):
+        """Set up test environment"""
+        self.mock_client = RecordingQdrantClient()
+
+        self.engine = QdrantEngine.from_client(self.mock_client)
+        self.session = QdrantSession(self.engine)
+
+    def test_invalid_quantization_rejected(self):
+        """Test that unknown quantization types raise ValueError"""
+        with self.assertRaises(ValueError):
+            VectorField(dimensions=4, quantization="float8")
+
+    def test_create_collection_sets_quantization_config(self):
+        """Test that create_collection passes quantization per named vector"""
+        self.engine.create_collection("quantized_documents", QuantizedDocument)
+
+        ((_, call_args),) = self.mock_client.calls["create_collection"]
+        vectors_config = call_args["vectors_config"]
+
+        image_config = vectors_config["image_embedding"].quantization_config
+        self.assertIsInstance(image_config, qmodels.BinaryQuantization)
+        self.assertIsNone(vectors_config["text_embedding"].quantization_config)
+
+    def test_search_rescores_quantized_field(self):
+        """Test that searching a quantized field requests rescoring"""
+        self.session.query(QuantizedDocument).vector_search(
+            QuantizedDocument.image_embedding,
+            [0.1, 0.2, 0.3, 0.4]
+        ).all()
+
+        ((_, call_args),) = self.mock_client.calls["search"]
+        quantization = call_args["search_params"].quantization
+        self.assertTrue(quantization.rescore)
+        self.assertEqual(quantization.oversampling, 2.0)
+
+    def test_search_without_quantization(self):
+        """Test that non-quantized fields do not send search params"""
+        self.session.query(QuantizedDocument).vector_search(
+            QuantizedDocument.text_embedding,
+            [0.1, 0.2, 0.3]
+        ).all()
+
+        ((_, call_args),) = self.mock_client.calls["search"]
+        self.assertNotIn("search_params", call_args)
+
+
+    def test_combined_search_quantization_hint(self):
+        """Test that combined search can request quantized rescoring for every field"""
+        self.session.query(QuantizedDocument).combined_vector_search(
+            vector_fields_with_weights={
+                QuantizedDocument.image_embedding: 0.5,
+                QuantizedDocument.text_embedding: 0.5
+            },
+            query_vectors={
+                "image_embedding": [0.1, 0.2, 0.3, 0.4],
+                "text_embedding": [0.1, 0.2, 0.3]
+            },
+            quantization=True,
+            oversampling=4.0
+        ).all()
+
+        ((_, call_kwargs),) = self.mock_client.calls["search_batch"]
+        requests = call_kwargs["requests"]
+        for request in requests:
+            self.assertTrue(request.params.quantization.rescore)
+            self.assertEqual(request.params.quantization.oversampling, 4.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,145 @@
+"""
+Tests for the parameters Query passes to the Qdrant client for vector searches
+
+Single-field searches must send a NamedVector as ``query_vector`` and combined
+searches one named SearchRequest per field. Neither may use the 'using',
+'vector_name' or 'named_vector' keyword arguments, which older versions of the
+Qdrant client do not support.
+"""
+from types import MappingProxyType, SimpleNamespace
+
+import numpy as np
+import pytest
+from qdrant_client.http.models import NamedVector
+
+from qdrant_orm.query import _prep_query
+
+from models import Document
+
+
+# Keyword arguments that older Qdrant clients reject
+_UNSUPPORTED_KWARGS = ("using", "vector_name", "named_vector")
+
+# One query vector per vector field; only their identity matters
+_VECTORS = {
+    "embedding": [0.1] * 128,
+    "image_embedding": [0.2] * 512,
+    "text_embedding": [0.3] * 384,
+}
+
+# Search hit shared by every test; the read-only payload keeps it unchanged
+_PAYLOAD = MappingProxyType({"id": "doc1", "title": "Test Document", "content": "Test content", "rating": 4.5})
+_POINT = SimpleNamespace(id="doc1", score=0.95, payload=_PAYLOAD, vector=None)
+
+
+def _f32(vector):
+    """Expected query vector of a combined search: the input at float32 precision"""
+    return np.asarray(vector, dtype=np.float32).tolist()
+
+
+def assert_search_kwargs(call_kwargs, forbid=_UNSUPPORTED_KWARGS, **expected):
+    """Check a client call's keyword arguments against expected values and forbidden names"""
+    for name, value in expected.items():
+        assert call_kwargs[name] == value, name
+    for name in forbid:
+        assert name not in call_kwargs
+
+
+@pytest.mark.parametrize("by_name", [False, True], ids=["descriptor", "string"])
+@pytest.mark.parametrize("field_name", list(_VECTORS))
+def test_single(field_name, by_name, session, fake_client):
+    """Test that a single-field search sends a NamedVector for that field"""
+    field = field_name if by_name else getattr(Document, field_name)
+    session.query(Document).vector_search(field, _VECTORS[field_name]).all()
+
+    ((_, call_kwargs),) = fake_client.calls["search"]
+    assert_search_kwargs(
+        call_kwargs,
+        collection_name="documents",
+        query_vector=NamedVector(name=field_name, vector=_VECTORS[field_name]),
+        with_payload=True,
+        with_vectors=False
+    )
+
+
+@pytest.mark.parametrize("field_names", [
+    ("embedding",),
+    ("image_embedding", "text_embedding"),
+    ("text_embedding", "embedding", "image_embedding"),
+])
+def test_combined(field_names, session, fake_client):
+    """Test that a combined search batches one named request per field, in order"""
+    session.query(Document).combined_vector_search(
+        vector_fields_with_weights={getattr(Document, name): 1.0 for name in field_names},
+        query_vectors={name: _VECTORS[name] for name in field_names}
+    ).all()
+
+    ((_, call_kwargs),) = fake_client.calls["search_batch"]
+    assert_search_kwargs(call_kwargs, collection_name="documents")
+    # Combined searches send their query vectors at float32 precision, unscaled
+    assert [request.vector for request in call_kwargs["requests"]] == [
+        NamedVector(name=name, vector=_f32(_VECTORS[name])) for name in field_names
+    ]
+
+
+def test_combined_query_vector_inputs(session, fake_client):
+    """Test that list and array query vectors are prepared to the same vectors"""
+    for convert in (list, np.asarray):
+        session.query(Document).combined_vector_search(
+            vector_fields_with_weights={Document.image_embedding: 0.5, Document.text_embedding: 0.5},
+            query_vectors={name: convert(_VECTORS[name]) for name in ("image_embedding", "text_embedding")}
+        ).all()
+
+    first, second = (call_kwargs["requests"] for _, call_kwargs in fake_client.calls["search_batch"])
+    assert [request.vector for request in first] == [request.vector for request in second]
+    assert [request.vector.vector for request in first] == [
+        _f32(_VECTORS[name]) for name in ("image_embedding", "text_embedding")
+    ]
+
+
+def test_prep_query_casts_to_float32():
+    """Test that query vectors are cast to float32 and not rescaled"""
+    prepared = _prep_query([3.0, 4.0])
+    assert prepared.dtype == np.float32
+    assert prepared.tolist() == [3.0, 4.0]
+    assert _prep_query(np.array([0.1, 0.2])).tolist() == _f32([0.1, 0.2])
+
+
+def test_combined_results(session, fake_client):
+    """Test that a point found by several fields comes back as one model"""
+    fake_client.return_values["search_batch"] = [[_POINT], [_POINT]]
+    fake_client.return_values["retrieve"] = [_POINT]
+
+    results = session.query(Document).combined_vector_search(
+        vector_fields_with_weights={
+            Document.image_embedding: 0.7,
+            Document.text_embedding: 0.3
+        },
+        query_vectors={
+            "image_embedding": _VECTORS["image_embedding"],
+            "text_embedding": _VECTORS["text_embedding"]
+        },
+        limit=5
+    ).all()
+
+    assert [doc.id for doc in results] == ["doc1"]
+    assert results[0].title == "Test Document"
+
+
+def test_combined_results_use_session_conversion(session, fake_client):
+    """Test that combined results are converted and validated like other searches"""
+    point = SimpleNamespace(id="doc1", score=None, payload={"title": "No original ID"}, vector=None)
+    fake_client.return_values["search_batch"] = [[_POINT]]
+    fake_client.return_values["retrieve"] = [point]
+    search = dict(
+        vector_fields_with_weights={Document.embedding: 1.0},
+        query_vectors={"embedding": _VECTORS["embedding"]}
+    )
+
+    (doc,) = session.query(Document).combined_vector_search(**search).all()
+    assert doc.to_dict() == session._point_to_model(point, Document).to_dict()
+    assert doc.id == "doc1"
+
+    # A stored vector of the wrong size fails validation instead of being returned
+    point.vector = {"embedding": [0.1, 0.2]}
+    assert session.query(Document).combined_vector_search(**search).all() == []
@@ -0,0 +1,46 @@
+"""
+Test for the Vector data type in Qdrant ORM
+"""
+import unittest
+
+import numpy as np
+
+from qdrant_orm.types import Vector
+
+
+class TestVectorType(unittest.TestCase):
+    """Test case for Vector.validate"""
+
+    def test_small_vector_validation(self):
+        """Test validation of low-dimensional vectors"""
+        vector_type = Vector(dimensions=3)
+        self.assertTrue(vector_type.validate([0.1, 2, 0.3]))
+        self.assertTrue(vector_type.validate(None))
+        self.assertFalse(Vector(dimensions=3, nullable=False).validate(None))
+        self.assertFalse(vector_type.validate([0.1, 0.2]))
+        self.assertFalse(vector_type.validate((0.1, 0.2, 0.3)))
+        self.assertFalse(vector_type.validate([0.1, "0.2", 0.3]))
+
+    def test_large_vector_validation(self):
+        """Test validation of high-dimensional vectors"""
+        vector_type = Vector(dimensions=1536)
+        self.assertTrue(vector_type.validate([0.5] * 1536))
+        self.assertTrue(vector_type.validate(list(range(1536))))
+        self.assertFalse(vector_type.validate([0.5] * 1535))
+        self.assertFalse(vector_type.validate([0.5] * 1535 + [None]))
+        self.assertFalse(vector_type.validate([0.5] * 1535 + ["0.5"]))
+        self.assertFalse(vector_type.validate([[0.5]] * 1536))
+
+    def test_numpy_scalars_rejected(self):
+        """Test that NumPy scalars are rejected for any number of dimensions"""
+        for n in (3, 40):
+            with self.subTest(n=n):
+                vector_type = Vector(dimensions=n)
+                self.assertTrue(vector_type.validate([1] * (n - 1) + [0.5]))
+                self.assertFalse(vector_type.validate([np.float32(0.5)] * n))
+                self.assertFalse(vector_type.validate(list(np.arange(n))))
+                self.assertFalse(vector_type.validate([0.5] * (n - 1) + [None]))
+                self.assertFalse(vector_type.validate([0.5] * (n - 1) + ["0.5"]))
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,21 +1,18 @@
 """
 Tests for weighted multi-vector search functionality in Qdrant ORM
 """
+import asyncio
 import unittest
-import numpy as np
-import os
-import sys
-from unittest.mock import MagicMock, patch
-
-# Add parent directory to path to import qdrant_orm
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
 
 from qdrant_orm import (
-    Base, Field, VectorField, 
+    Base, Field, VectorField,
     QdrantEngine, QdrantSession,
-    String, Integer, Float, Boolean, Vector
+    String, Float
 )
-from qdrant_orm.crud import CRUDOperations
+
+from _fakes import RecordingQdrantClient
 
 
 # Define test model with multiple vector fields
@@ -35,6 +32,9 @@ class TestProduct(Base):
 class MockPoint:
     """Mock Qdrant point for testing"""
     
+    # score stays unset unless given, like points from non-search calls
+    __slots__ = ("id", "payload", "vector", "score")
+    
     def __init__(self, id, payload, vector=None, score=None):
         self.id = id
         self.payload = payload
@@ -43,117 +43,59 @@ class MockPoint:
             self.score = score
 
 
-@patch('qdrant_client.QdrantClient')
+# Payload and vectors of each stored product, shared by every point built from it
+_PRODUCTS = {
+    "prod1": {
+        "payload": {"name": "Product 1", "category": "electronics", "price": 10.0},
+        "vector": {"image_embedding": [0.1, 0.2, 0.3, 0.4], "text_embedding": [0.5, 0.6, 0.7]},
+    },
+    "prod2": {
+        "payload": {"name": "Product 2", "category": "clothing", "price": 20.0},
+        "vector": {"image_embedding": [0.2, 0.3, 0.4, 0.5], "text_embedding": [0.6, 0.7, 0.8]},
+    },
+    "prod3": {
+        "payload": {"name": "Product 3", "category": "home", "price": 30.0},
+        "vector": {"image_embedding": [0.3, 0.4, 0.5, 0.6], "text_embedding": [0.7, 0.8, 0.9]},
+    },
+    "prod4": {
+        "payload": {"name": "Product 4", "category": "books", "price": 40.0},
+        "vector": {"image_embedding": [0.4, 0.5, 0.6, 0.7], "text_embedding": [0.8, 0.9, 1.0]},
+    },
+}
+
+
+def _point(pid, score):
+    """Build a search hit for a stored product"""
+    product = _PRODUCTS[pid]
+    return MockPoint(id=pid, payload=product["payload"], vector=product["vector"], score=score)
+
+
 class TestWeightedVectorSearch(unittest.TestCase):
     """Test case for weighted vector search functionality"""
     
+    @classmethod
+    def setUpClass(cls):
+        """Create the engine once for all tests"""
+        cls.engine = QdrantEngine.from_client(RecordingQdrantClient())
+    
     def setUp(self):
-        """Set up test environment"""
-        self.mock_client = MagicMock()
+        """Give each test a fresh recording client and session"""
+        self.mock_client = RecordingQdrantClient()
         
-        # Create a patched engine that uses our mock client
-        with patch('qdrant_orm.engine.QdrantClient', return_value=self.mock_client):
-            self.engine = QdrantEngine(url="localhost", port=6333)
-            self.session = QdrantSession(self.engine)
+        # Point the shared engine at this test's mock; the session picks it up
+        self.engine.client = self.mock_client
+        self.engine.async_client = None
+        self.session = QdrantSession(self.engine)
     
-    def test_combined_vector_search(self, mock_qdrant):
+    def test_combined_vector_search(self):
         """Test combined vector search with weights"""
-        # Setup mock responses for image search
-        image_results = [
-            MockPoint(
-                id="prod1",
-                payload={
-                    "name": "Product 1", 
-                    "category": "electronics", 
-                    "price": 10.0
-                },
-                vector={
-                    "image_embedding": [0.1, 0.2, 0.3, 0.4],
-                    "text_embedding": [0.5, 0.6, 0.7]
-                },
-                score=0.95
-            ),
-            MockPoint(
-                id="prod2",
-                payload={
-                    "name": "Product 2", 
-                    "category": "clothing", 
-                    "price": 20.0
-                },
-                vector={
-                    "image_embedding": [0.2, 0.3, 0.4, 0.5],
-                    "text_embedding": [0.6, 0.7, 0.8]
-                },
-                score=0.85
-            ),
-            MockPoint(
-                id="prod3",
-                payload={
-                    "name": "Product 3", 
-                    "category": "home", 
-                    "price": 30.0
-                },
-                vector={
-                    "image_embedding": [0.3, 0.4, 0.5, 0.6],
-                    "text_embedding": [0.7, 0.8, 0.9]
-                },
-                score=0.75
-            )
-        ]
+        # Per-field search results; prod1 and prod3 are found by both fields
+        image_results = [_point("prod1", 0.95), _point("prod2", 0.85), _point("prod3", 0.75)]
+        text_results = [_point("prod3", 0.92), _point("prod4", 0.88), _point("prod1", 0.65)]
         
-        # Setup mock responses for text search
-        text_results = [
-            MockPoint(
-                id="prod3",
-                payload={
-                    "name": "Product 3", 
-                    "category": "home", 
-                    "price": 30.0
-                },
-                vector={
-                    "image_embedding": [0.3, 0.4, 0.5, 0.6],
-                    "text_embedding": [0.7, 0.8, 0.9]
-                },
-                score=0.92
-            ),
-            MockPoint(
-                id="prod4",
-                payload={
-                    "name": "Product 4", 
-                    "category": "books", 
-                    "price": 40.0
-                },
-                vector={
-                    "image_embedding": [0.4, 0.5, 0.6, 0.7],
-                    "text_embedding": [0.8, 0.9, 1.0]
-                },
-                score=0.88
-            ),
-            MockPoint(
-                id="prod1",
-                payload={
-                    "name": "Product 1", 
-                    "category": "electronics", 
-                    "price": 10.0
-                },
-                vector={
-                    "image_embedding": [0.1, 0.2, 0.3, 0.4],
-                    "text_embedding": [0.5, 0.6, 0.7]
-                },
-                score=0.65
-            )
-        ]
-        
-        # Configure mock to return different results based on which vector field is queried
-        def mock_search(**kwargs):
-            query_vector = kwargs.get('query_vector')
-            if isinstance(query_vector, tuple) and query_vector[0] == 'image_embedding':
-                return image_results
-            elif isinstance(query_vector, tuple) and query_vector[0] == 'text_embedding':
-                return text_results
-            return []
-        
-        self.mock_client.search.side_effect = mock_search
+        # Configure mock to return one result list per vector field, in request order
+        self.mock_client.return_values["search_batch"] = [image_results, text_results]
+        self.mock_client.return_values["retrieve"] = image_results + [text_results[1]]
         
         # Create query vectors
         query_image_vector = [0.1, 0.2, 0.3, 0.4]
@@ -172,8 +114,10 @@ class TestWeightedVectorSearch(unittest.TestCase):
             limit=3
         ).all()
         
-        # Verify search was called for each vector field
-        self.assertEqual(self.mock_client.search.call_count, 2)
+        # Verify a single batched search was issued with one request per vector field
+        self.assertEqual(len(self.mock_client.calls["search_batch"]), 1)
+        requests = self.mock_client.calls["search_batch"][-1][1]['requests']
+        self.assertEqual([r.vector.name for r in requests], ["image_embedding", "text_embedding"])
         
         # Verify results
         self.assertEqual(len(results), 3)
@@ -191,27 +135,14 @@ class TestWeightedVectorSearch(unittest.TestCase):
         # The third result could be either prod2 or prod4 depending on implementation details
         self.assertIn(results[2].id, ["prod2", "prod4"])
     
-    def test_combined_search_with_filters(self, mock_qdrant):
+    def test_combined_search_with_filters(self):
         """Test combined vector search with additional filters"""
         # Setup mock responses
-        filtered_results = [
-            MockPoint(
-                id="prod1",
-                payload={
-                    "name": "Product 1", 
-                    "category": "electronics", 
-                    "price": 10.0
-                },
-                vector={
-                    "image_embedding": [0.1, 0.2, 0.3, 0.4],
-                    "text_embedding": [0.5, 0.6, 0.7]
-                },
-                score=0.9
-            )
-        ]
+        filtered_results = [_point("prod1", 0.9)]
         
         # Configure mock to return filtered results
-        self.mock_client.search.return_value = filtered_results
+        self.mock_client.return_values["search_batch"] = [filtered_results, filtered_results]
+        self.mock_client.return_values["retrieve"] = filtered_results
         
         # Create query vectors
         query_image_vector = [0.1, 0.2, 0.3, 0.4]
@@ -233,13 +164,14 @@ class TestWeightedVectorSearch(unittest.TestCase):
             limit=2
         ).all()
         
-        # Verify search was called with filters
-        self.assertEqual(self.mock_client.search.call_count, 2)
+        # Verify a single batched search was issued
+        self.assertEqual(len(self.mock_client.calls["search_batch"]), 1)
         
-        # Check that filter was passed to search
-        for call_args in self.mock_client.search.call_args_list:
-            kwargs = call_args[1]
-            self.assertIn('filter', kwargs)
+        # Check that filter was passed to every search request, translated only once
+        requests = self.mock_client.calls["search_batch"][-1][1]['requests']
+        self.assertIsNotNone(requests[0].filter)
+        for request in requests[1:]:
+            self.assertIs(request.filter, requests[0].filter)
         
         # Verify results
         self.assertEqual(len(results), 1)
@@ -247,7 +179,199 @@ class TestWeightedVectorSearch(unittest.TestCase):
         self.assertEqual(results[0].category, "electronics")
         self.assertEqual(results[0].price, 10.0)
     
-    def test_error_handling(self, mock_qdrant):
+    def test_concurrent_combined_search(self):
+        """Test combined vector search issuing per-field searches concurrently"""
+        image_results = [MockPoint(id="prod1", payload={"name": "Product 1"}, score=0.9)]
+        text_results = [
+            MockPoint(id="prod2", payload={"name": "Product 2"}, score=0.8),
+            MockPoint(id="prod1", payload={"name": "Product 1"}, score=0.5)
+        ]
+
+        mock_async_client = SimpleNamespace(search=AsyncMock(side_effect=[image_results, text_results]))
+        self.engine.async_client = mock_async_client
+        self.mock_client.return_values["retrieve"] = text_results
+
+        results = self.session.query(TestProduct).combined_vector_search(
+            vector_fields_with_weights={
+                TestProduct.image_embedding: 0.5,
+                TestProduct.text_embedding: 0.5
+            },
+            query_vectors={
+                "image_embedding": [0.1, 0.2, 0.3, 0.4],
+                "text_embedding": [0.5, 0.6, 0.7]
+            },
+            limit=2,
+            concurrent=True
+        ).all()
+
+        # One async search per vector field, no batched or sync searches
+        self.assertEqual(mock_async_client.search.await_count, 2)
+        self.assertEqual(self.mock_client.calls["search_batch"], [])
+        self.assertEqual(self.mock_client.calls["search"], [])
+
+        # prod1: 0.9*0.5 + 0.5*0.5 = 0.7, prod2: 0.8*0.5 = 0.4
+        self.assertEqual([r.id for r in results], ["prod1", "prod2"])
+
+    def test_concurrent_searches_overlap(self):
+        """Test that concurrent per-field searches are all in flight at once"""
+        in_flight = []
+        peak = []
+
+        async def search(**kwargs):
+            in_flight.append(kwargs["query_vector"].name)
+            peak.append(len(in_flight))
+            await asyncio.sleep(0)
+            in_flight.remove(kwargs["query_vector"].name)
+            return []
+
+        self.engine.async_client = SimpleNamespace(search=search)
+
+        self.session.query(TestProduct).combined_vector_search(
+            vector_fields_with_weights={
+                TestProduct.image_embedding: 0.5,
+                TestProduct.text_embedding: 0.5
+            },
+            query_vectors={
+                "image_embedding": [0.1, 0.2, 0.3, 0.4],
+                "text_embedding": [0.5, 0.6, 0.7]
+            },
+            concurrent=True
+        ).all()
+
+        # The second search starts before the first one yields its result
+        self.assertEqual(max(peak), 2)
+
+    def test_combined_search_skips_vectors(self):
+        """Test that vectors are only fetched when the query asks for them"""
+        results = [MockPoint(id="prod1", payload={"name": "Product 1"}, score=0.9)]
+        self.mock_client.return_values["search_batch"] = [results, results]
+        self.mock_client.return_values["retrieve"] = results
+
+        for needs_vectors in (False, True):
+            self.session.query(TestProduct).with_vectors(needs_vectors).combined_vector_search(
+                vector_fields_with_weights={
+                    TestProduct.image_embedding: 0.5,
+                    TestProduct.text_embedding: 0.5
+                },
+                query_vectors={
+                    "image_embedding": [0.1, 0.2, 0.3, 0.4],
+                    "text_embedding": [0.5, 0.6, 0.7]
+                }
+            ).all()
+
+        # Score fusion only needs ids and scores from the per-field searches
+        for search_call in self.mock_client.calls["search_batch"]:
+            for request in search_call[1]["requests"]:
+                self.assertFalse(request.with_payload)
+                self.assertFalse(request.with_vector)
+
+        # Payload and, on request, vectors are fetched once for the fused top-K
+        retrieve_calls = self.mock_client.calls["retrieve"]
+        self.assertEqual([c[1]["with_payload"] for c in retrieve_calls], [True, True])
+        self.assertEqual([c[1]["with_vectors"] for c in retrieve_calls], [False, True])
+
+    def test_weights_normalized_up_front(self):
+        """Test that weights are normalized when the combined search is configured"""
+        query = self.session.query(TestProduct).combined_vector_search(
+            vector_fields_with_weights={
+                TestProduct.image_embedding: 3.0,
+                TestProduct.text_embedding: 1.0
+            },
+            query_vectors={
+                "image_embedding": [0.1, 0.2, 0.3, 0.4],
+                "text_embedding": [0.5, 0.6, 0.7]
+            }
+        )
+        self.assertEqual(
+            query._combined_search_params["normalized"],
+            {"image_embedding": 0.75, "text_embedding": 0.25}
+        )
+
+        # Degenerate weights are rejected before any search is issued
+        with self.assertRaises(ValueError):
+            self.session.query(TestProduct).combined_vector_search(
+                vector_fields_with_weights={TestProduct.image_embedding: 0.0},
+                query_vectors={"image_embedding": [0.1, 0.2, 0.3, 0.4]}
+            )
+        self.assertEqual(self.mock_client.calls["search_batch"], [])
+
+    def test_zero_weight_field_not_searched(self):
+        """Test that a field with zero weight is left out of the search"""
+        self.mock_client.return_values["search_batch"] = [[_point("prod1", 0.9)]]
+        self.mock_client.return_values["retrieve"] = []
+
+        self.session.query(TestProduct).combined_vector_search(
+            vector_fields_with_weights={
+                TestProduct.image_embedding: 1.0,
+                TestProduct.text_embedding: 0.0
+            },
+            query_vectors={
+                "image_embedding": [0.1, 0.2, 0.3, 0.4],
+                "text_embedding": [0.5, 0.6, 0.7]
+            }
+        ).all()
+
+        (request,) = self.mock_client.calls["search_batch"][-1][1]["requests"]
+        self.assertEqual(request.vector.name, "image_embedding")
+
+    def test_rrf_fusion(self):
+        """Test that reciprocal rank fusion ignores the scale of per-field scores"""
+        image_results = [_point("prod1", 0.9)]
+        # Scores on a much larger scale than the image field's
+        text_results = [_point("prod2", 50.0), _point("prod1", 40.0)]
+
+        def search(fusion):
+            self.mock_client.return_values["search_batch"] = [image_results, text_results]
+            self.mock_client.return_values["retrieve"] = [_point("prod1", 0.9), _point("prod2", 50.0)]
+            return self.session.query(TestProduct).combined_vector_search(
+                vector_fields_with_weights={
+                    TestProduct.image_embedding: 0.5,
+                    TestProduct.text_embedding: 0.5
+                },
+                query_vectors={
+                    "image_embedding": [0.1, 0.2, 0.3, 0.4],
+                    "text_embedding": [0.5, 0.6, 0.7]
+                },
+                limit=2,
+                fusion=fusion
+            ).all()
+
+        # weighted: prod2 = 25.0, prod1 = 0.45 + 20.0
+        self.assertEqual([r.id for r in search("weighted")], ["prod2", "prod1"])
+        # rrf: prod1 = 0.5/61 + 0.5/62, prod2 = 0.5/61
+        self.assertEqual([r.id for r in search("rrf")], ["prod1", "prod2"])
+
+        with self.assertRaises(ValueError):
+            search("max")
+
+    def test_candidate_factor(self):
+        """Test that each field fetches limit * candidate_factor candidates"""
+        image_results = [MockPoint(id="prod1", payload={}, score=0.9)]
+        text_results = [MockPoint(id="prod2", payload={}, score=0.7)]
+        self.mock_client.return_values["search_batch"] = [image_results, text_results]
+        self.mock_client.return_values["retrieve"] = text_results
+
+        results = self.session.query(TestProduct).combined_vector_search(
+            vector_fields_with_weights={
+                TestProduct.image_embedding: 0.1,
+                TestProduct.text_embedding: 0.9
+            },
+            query_vectors={
+                "image_embedding": [0.1, 0.2, 0.3, 0.4],
+                "text_embedding": [0.5, 0.6, 0.7]
+            },
+            limit=1,
+            candidate_factor=1.5
+        ).all()
+
+        # Both fields go out in one batch, each asking for ceil(1 * 1.5) candidates
+        ((_, call_kwargs),) = self.mock_client.calls["search_batch"]
+        self.assertEqual([request.limit for request in call_kwargs["requests"]], [2, 2])
+        self.assertEqual([request.score_threshold for request in call_kwargs["requests"]], [None, None])
+        # prod2 = 0.9 * 0.7 beats prod1 = 0.1 * 0.9
+        self.assertEqual([r.id for r in results], ["prod2"])
+
+    def test_error_handling(self):
         """Test error handling in combined vector search"""
         # Create query vectors
         query_image_vector = [0.1, 0.2, 0.3, 0.4]
@@ -266,6 +390,9 @@ class TestWeightedVectorSearch(unittest.TestCase):
                 limit=3
             ).all()
 
+        # The configuration is rejected before any search is issued
+        self.assertEqual(self.mock_client.calls["search_batch"], [])
+
 
 if __name__ == "__main__":
     unittest.main()